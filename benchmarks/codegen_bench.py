@@ -0,0 +1,55 @@
+"""
+Сравнение табличного ДКА (DfaMatcher) и сгенерированной функции
+(smc.codegen) на проверке цепочек. Для каждого выражения выводятся
+число состояний ДКА и время проверки набора цепочек.
+Запуск из корня репозитория: python -m benchmarks.codegen_bench
+"""
+import random
+import time
+
+from smc.cache import build_dfa
+from smc.codegen import build_function
+
+PATTERNS = [
+    '(a|b)*abb',
+    '[a-zA-Z]([a-zA-Z0-9])*',
+    'a?b?(abc)*',
+    '(a|b)*a' + '(a|b)' * 6,
+    '(' + '|'.join('abcdefgh') + ')*' + 'abcdefgh' * 5,
+]
+
+
+def generate_chains(regex, count=200, length=200, seed=0):
+    rng = random.Random(seed)
+    alphabet = sorted({char for char in regex if char.isalnum()})
+    return [''.join(rng.choice(alphabet) for _ in range(length)) for _ in range(count)]
+
+
+def measure(match, chains, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for chain in chains:
+            match(chain)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    row = '{:<42} {:>7} {:>10} {:>10} {:>8}'
+    print(row.format('regex', 'states', 'table ms', 'code ms', 'speedup'))
+    for regex in PATTERNS:
+        dfa = build_dfa(regex)
+        matcher = dfa.compile()
+        function = build_function(dfa.dfa)
+        chains = generate_chains(regex)
+
+        table_time = measure(matcher.match, chains)
+        code_time = measure(function, chains)
+        print(row.format(regex if len(regex) <= 42 else regex[:39] + '...', len(dfa.dfa.states),
+                         '{:.2f}'.format(table_time * 1000), '{:.2f}'.format(code_time * 1000),
+                         '{:.2f}'.format(table_time / code_time)))
+
+
+if __name__ == '__main__':
+    main()
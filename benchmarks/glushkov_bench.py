@@ -0,0 +1,63 @@
+"""
+Сравнение построителей НКА: Томпсона (NfaRegex) и Глушкова (GlushkovRegex).
+Для каждого выражения выводятся размеры НКА и время детерминизации.
+Запуск из корня репозитория: python -m benchmarks.glushkov_bench
+"""
+import time
+
+from config import BaseConfig
+from smc.dfa import DfaNfa
+from smc.glushkov import GlushkovRegex
+from smc.nfa import NfaRegex
+
+PATTERNS = [
+    '(a|b)*abb',
+    'a?b?(abc)*',
+    '(a|b)*a' + '(a|b)' * 8,
+    '(' + '|'.join('abcdefgh') + ')*' + 'abcdefgh' * 20,
+    '((a|b)*c(d|e)*)?' * 10,
+]
+
+
+def measure(builder_class, regex, repeat=3):
+    best_build = best_dfa = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        builder = builder_class(regex)
+        builder.build()
+        built = time.perf_counter()
+        dfa = DfaNfa(builder.nfa)
+        dfa.build()
+        finished = time.perf_counter()
+
+        best_build = min(best_build, built - start)
+        best_dfa = min(best_dfa, finished - built)
+
+    nfa = builder.nfa
+    epsilon_count = sum(1 for transition in nfa.transitions if transition[2] == BaseConfig.EPSILON)
+    return {
+        'nfa_states': len(nfa.states),
+        'nfa_transitions': len(nfa.transitions),
+        'epsilon_transitions': epsilon_count,
+        'dfa_states': len(dfa.dfa.states),
+        'build_ms': best_build * 1000,
+        'determinize_ms': best_dfa * 1000,
+    }
+
+
+def main():
+    row = '{:<10} {:>8} {:>8} {:>8} {:>8} {:>10} {:>14}'
+    for regex in PATTERNS:
+        print(regex if len(regex) <= 70 else regex[:67] + '...')
+        print(row.format('builder', 'states', 'trans', 'eps', 'dfa', 'build ms', 'determinize ms'))
+        for name, builder_class in [('thompson', NfaRegex), ('glushkov', GlushkovRegex)]:
+            result = measure(builder_class, regex)
+            print(row.format(name, result['nfa_states'], result['nfa_transitions'],
+                             result['epsilon_transitions'], result['dfa_states'],
+                             '{:.2f}'.format(result['build_ms']),
+                             '{:.2f}'.format(result['determinize_ms'])))
+        print()
+
+
+if __name__ == '__main__':
+    main()
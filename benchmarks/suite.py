@@ -0,0 +1,267 @@
+"""
+Набор тестов производительности: построение НКА, детерминизация,
+минимизация и проверка цепочек. Выражения строятся семействами с
+параметром (размер выражения, глубина вложенности, экспоненциальный
+рост ДКА для (a|b)*a(a|b){n}), каждый этап измеряется отдельно.
+Результаты выводятся таблицей и могут быть записаны в JSON для
+сравнения запусков.
+
+Запуск из корня репозитория:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --quick --compare results.json
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from config import BaseConfig, MatcherConfig
+from smc.dfa import DfaNfa
+from smc.nfa import NfaRegex
+from utils import prepare_regex
+
+SYMBOLS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def size_regex(n):
+    """Выражение длины O(n) без вложенности: ((a|b)c)^n"""
+    return '((a|b)c)' * n
+
+
+def depth_regex(n):
+    """Выражение с вложенностью n: каждый уровень - ((r)*x|y) для выражения
+    r предыдущего уровня, например depth_regex(1) = ((a)*b|c),
+    depth_regex(2) = ((((a)*b|c))*d|e)"""
+    regex = 'a'
+    for i in range(n):
+        regex = '(({})*{}|{})'.format(regex, SYMBOLS[(2 * i + 1) % 26], SYMBOLS[(2 * i + 2) % 26])
+    return regex
+
+
+def blowup_regex(n):
+    """(a|b)*a(a|b){n}: минимальный ДКА имеет 2^(n+1) состояний"""
+    return '(a|b)*a' + '(a|b)' * n
+
+
+FAMILIES = {
+    'size': (size_regex, [8, 32, 128]),
+    'depth': (depth_regex, [2, 4, 8]),
+    'blowup': (blowup_regex, [4, 8, 12]),
+}
+
+QUICK_FAMILIES = {
+    'size': (size_regex, [8, 32]),
+    'depth': (depth_regex, [2, 4]),
+    'blowup': (blowup_regex, [4, 8]),
+}
+
+
+def generate_chains(dfa, total_length, seed=0):
+    """
+    Цепочки для проверки: случайные пути по минимальному ДКА. В нем нет
+    тупиковых состояний, поэтому каждая цепочка читается целиком, а не
+    отбрасывается на первых символах.
+    """
+    rng = random.Random(seed)
+    moves = dict()
+    for start_state, end_state, symbol in dfa.transitions:
+        moves.setdefault(start_state, []).append((dfa.get_symbol_chars(symbol), end_state))
+
+    chains = []
+    length = 0
+    while length < total_length:
+        state = dfa.init_state
+        chain = []
+        while len(chain) < 1000 and state in moves:
+            chars, state = rng.choice(moves[state])
+            chain.append(rng.choice(chars))
+        chains.append(''.join(chain))
+        length += max(len(chain), 1)
+    return chains
+
+
+def run_stages(regex):
+    """Этапы обработки выражения: список (имя, функция без аргументов),
+    функции выполняются по порядку и сохраняют результаты в context"""
+    context = dict()
+
+    def prepare():
+        prepare_regex(regex)
+
+    def nfa_build():
+        nfa = NfaRegex(regex)
+        nfa.build()
+        context['nfa'] = nfa.nfa
+
+    def dfa_build():
+        context['dfa'] = DfaNfa(context['nfa'])
+        context['dfa'].build()
+
+    def minimize():
+        context['dfa'].minimize()
+
+    def compile_table():
+        context['matcher'] = context['dfa'].compile()
+
+    stages = [
+        ('prepare_regex', prepare),
+        ('nfa_build', nfa_build),
+        ('dfa_build', dfa_build),
+        ('minimize', minimize),
+        ('compile', compile_table),
+    ]
+    return stages, context
+
+
+def measure_stages(regex, repeat):
+    """Время каждого этапа (наименьшее и медиана по repeat запускам)
+    и пиковый объем выделенной памяти (отдельный запуск с tracemalloc)"""
+    timings = dict()
+    for _ in range(repeat):
+        stages, context = run_stages(regex)
+        for name, stage in stages:
+            start = time.perf_counter()
+            stage()
+            timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    peak_memory = dict()
+    stages, _ = run_stages(regex)
+    tracemalloc.start()
+    try:
+        for name, stage in stages:
+            tracemalloc.reset_peak()
+            stage()
+            peak_memory[name] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    stage_results = {name: {'best_ms': min(values) * 1000, 'median_ms': statistics.median(values) * 1000}
+                     for name, values in timings.items()}
+    return stage_results, peak_memory, context
+
+
+def count_dfa(dfa):
+    return {'states': len(dfa.states), 'transitions': len(dfa.transitions)}
+
+
+def run_case(family, param, regex, repeat, match_length):
+    stage_results, peak_memory, context = measure_stages(regex, repeat)
+
+    # Размеры автоматов до и после минимизации
+    nfa = context['nfa']
+    dfa = DfaNfa(nfa)
+    dfa.build()
+    counts = {
+        'nfa': {'states': len(nfa.states), 'transitions': len(nfa.transitions),
+                'epsilon_transitions': sum(1 for transition in nfa.transitions
+                                           if transition[2] == BaseConfig.EPSILON)},
+        'dfa': count_dfa(dfa.dfa),
+        'min_dfa': count_dfa(context['dfa'].dfa),
+        'alphabet': len(nfa.language),
+    }
+
+    matcher = context['matcher']
+    chains = generate_chains(context['dfa'].dfa, match_length)
+    chars_count = sum(len(chain) for chain in chains)
+    match_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for chain in chains:
+            matcher.match(chain)
+        match_times.append(time.perf_counter() - start)
+
+    return {
+        'family': family,
+        'param': param,
+        'regex': regex,
+        'regex_length': len(regex),
+        'stages': stage_results,
+        'peak_memory_bytes': peak_memory,
+        'counts': counts,
+        'match': {
+            'chars': chars_count,
+            'best_ms': min(match_times) * 1000,
+            'chars_per_s': chars_count / min(match_times) if min(match_times) > 0 else None,
+        },
+    }
+
+
+def get_metadata():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'engine_version': MatcherConfig.ENGINE_VERSION,
+    }
+
+
+def print_results(results, baseline=None):
+    baseline_results = dict()
+    if baseline is not None:
+        baseline_results = {(result['family'], result['param']): result for result in baseline['results']}
+
+    row = '{:<8} {:>5} {:>8} {:>8} {:>9} {:>9} {:>9} {:>9} {:>10} {:>8}'
+    # speedup - отношение суммарного времени этапов в сравниваемом запуске к текущему
+    print(row.format('family', 'n', 'nfa', 'min dfa', 'nfa ms', 'dfa ms', 'min ms', 'peak KB', 'Mchars/s',
+                     'speedup'))
+    for result in results:
+        stages = result['stages']
+        total_ms = sum(stage['best_ms'] for stage in stages.values())
+
+        ratio = ''
+        base = baseline_results.get((result['family'], result['param']))
+        if base is not None:
+            base_total_ms = sum(stage['best_ms'] for stage in base['stages'].values())
+            ratio = '{:.2f}x'.format(base_total_ms / total_ms) if total_ms > 0 else ''
+
+        chars_per_s = result['match']['chars_per_s']
+        print(row.format(result['family'], result['param'], result['counts']['nfa']['states'],
+                         result['counts']['min_dfa']['states'],
+                         '{:.2f}'.format(stages['nfa_build']['best_ms']),
+                         '{:.2f}'.format(stages['dfa_build']['best_ms']),
+                         '{:.2f}'.format(stages['minimize']['best_ms']),
+                         max(result['peak_memory_bytes'].values()) // 1024,
+                         '{:.2f}'.format(chars_per_s / 1e6) if chars_per_s else '-',
+                         ratio))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Regex engine benchmark suite')
+    parser.add_argument('--output', help='write results to JSON file')
+    parser.add_argument('--compare', help='JSON file of a previous run to compare total build time with')
+    parser.add_argument('--family', action='append', choices=sorted(FAMILIES), help='run only given families')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per stage, best and median are reported')
+    parser.add_argument('--match-length', type=int, default=200000, help='characters to match per case')
+    parser.add_argument('--quick', action='store_true', help='smaller parameters for a fast check')
+    args = parser.parse_args(args)
+
+    families = QUICK_FAMILIES if args.quick else FAMILIES
+    match_length = args.match_length // 10 if args.quick else args.match_length
+
+    results = []
+    for family, (make_regex, params) in families.items():
+        if args.family and family not in args.family:
+            continue
+        for param in params:
+            results.append(run_case(family, param, make_regex(param), args.repeat, match_length))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'metadata': get_metadata(), 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
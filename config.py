@@ -16,7 +16,20 @@ class RegexConfig:
     ONE_OR_MORE = '?'
     OPEN_BRACKET = '('
     CLOSE_BRACKET = ')'
+    CLASS_OPEN = '['
+    CLASS_CLOSE = ']'
+    CLASS_RANGE = '-'
+    CLASS_NEGATE = '^'
 
     VALID_OPERATORS = OR + AND + ZERO_OR_MORE + ONE_OR_MORE + OPEN_BRACKET + CLOSE_BRACKET
+    VALID_CLASS_CHARS = CLASS_OPEN + CLASS_CLOSE + CLASS_RANGE + CLASS_NEGATE
     VALID_SYMBOLS = string.ascii_letters + string.digits
-    VALID_CHARS = VALID_SYMBOLS + VALID_OPERATORS
+    VALID_CHARS = VALID_SYMBOLS + VALID_OPERATORS + VALID_CLASS_CHARS
+
+
+class MatcherConfig:
+    LAZY_DFA_CACHE_SIZE = 1024
+    PATTERN_CACHE_SIZE = 256
+    ENGINE_VERSION = 2
+    CODEGEN_VERSION = 1
+    disk_cache_dir = root_dir + '/cache'
@@ -0,0 +1,393 @@
+from collections import deque
+
+from config import RegexConfig
+from utils import get_symbol_chars, prepare_regex
+
+
+class Node:
+    """
+    Узел синтаксического дерева регулярного выражения. Узлы неизменяемы
+    и сравниваются по содержимому, что используется при упрощении.
+    Хэш и допустимость пустой цепочки вычисляются при создании узла по
+    значениям дочерних узлов, поэтому не требуют обхода поддерева.
+    """
+
+    __slots__ = ('_hash', '_nullable')
+
+    def __init__(self, nullable):
+        self._hash = hash((type(self).__name__, self._key()))
+        self._nullable = nullable
+
+    def _key(self):
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        if not isinstance(other, Node):
+            return NotImplemented
+
+        # Сравнение без рекурсии: глубина дерева может превышать предел рекурсии
+        stack = [(self, other)]
+        while stack:
+            node1, node2 = stack.pop()
+            if node1 is node2:
+                continue
+            if type(node1) is not type(node2) or node1._hash != node2._hash:
+                return False
+
+            key1 = node1._key()
+            key2 = node2._key()
+            if len(key1) != len(key2):
+                return False
+            for item1, item2 in zip(key1, key2):
+                if isinstance(item1, Node):
+                    stack.append((item1, item2))
+                elif item1 != item2:
+                    return False
+
+        return True
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(repr(key) for key in self._key()))
+
+
+class Epsilon(Node):
+    """Пустая цепочка. Появляется только при вынесении общих префиксов"""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(True)
+
+    def _key(self):
+        return ()
+
+
+class Symbol(Node):
+    """Один символ из множества chars"""
+
+    __slots__ = ('chars',)
+
+    def __init__(self, chars):
+        self.chars = frozenset(chars)
+        super().__init__(False)
+
+    def _key(self):
+        return (''.join(sorted(self.chars)),)
+
+
+class Concat(Node):
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        super().__init__(all(item._nullable for item in self.items))
+
+    def _key(self):
+        return self.items
+
+
+class Union(Node):
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        super().__init__(any(item._nullable for item in self.items))
+
+    def _key(self):
+        return self.items
+
+
+class Star(Node):
+    __slots__ = ('item',)
+
+    def __init__(self, item):
+        self.item = item
+        super().__init__(True)
+
+    def _key(self):
+        return (self.item,)
+
+
+class Plus(Node):
+    __slots__ = ('item',)
+
+    def __init__(self, item):
+        self.item = item
+        super().__init__(item._nullable)
+
+    def _key(self):
+        return (self.item,)
+
+
+def get_children(node):
+    if isinstance(node, (Star, Plus)):
+        return (node.item,)
+    if isinstance(node, (Concat, Union)):
+        return node.items
+    return ()
+
+
+def reduce_tree(node, function):
+    """
+    Вычисление function(узел, результаты дочерних узлов) для всех узлов
+    дерева: дочерние узлы обрабатываются раньше родительского, слева
+    направо. Обход идет по явному стеку, а не рекурсией, поэтому глубина
+    дерева не ограничена пределом рекурсии.
+    """
+    results = []
+    stack = [(node, False)]
+    while stack:
+        node, is_visited = stack.pop()
+        children = get_children(node)
+        if children and not is_visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children))
+            continue
+
+        if children:
+            child_results = results[len(results) - len(children):]
+            del results[len(results) - len(children):]
+        else:
+            child_results = []
+        results.append(function(node, child_results))
+
+    return results.pop()
+
+
+def _make_concat(items):
+    flat_items = []
+    for item in items:
+        if isinstance(item, Concat):
+            flat_items.extend(item.items)
+        else:
+            flat_items.append(item)
+    return Concat(flat_items)
+
+
+def _make_union(items):
+    flat_items = []
+    for item in items:
+        if isinstance(item, Union):
+            flat_items.extend(item.items)
+        else:
+            flat_items.append(item)
+    return Union(flat_items)
+
+
+class _Items:
+    """Элементы строящегося узла Concat или Union. Узел создается один
+    раз, когда он становится операндом другой операции"""
+
+    __slots__ = ('node_type', 'items')
+
+    def __init__(self, node_type, items):
+        self.node_type = node_type
+        self.items = items
+
+    def get_node(self):
+        return self.node_type(self.items)
+
+
+def _get_node(item):
+    return item.get_node() if isinstance(item, _Items) else item
+
+
+def _get_items(item, node_type):
+    if isinstance(item, _Items) and item.node_type is node_type:
+        return item.items
+    item = _get_node(item)
+    if isinstance(item, node_type):
+        return deque(item.items)
+    return deque([item])
+
+
+def _join(node_type, item1, item2):
+    items1 = _get_items(item1, node_type)
+    items2 = _get_items(item2, node_type)
+
+    # Меньший список элементов добавляется к большему, поэтому каждый
+    # элемент копируется O(log n) раз даже при вложенности вида a(b(cd))
+    if len(items1) >= len(items2):
+        items1.extend(items2)
+        return _Items(node_type, items1)
+    items2.extendleft(reversed(items1))
+    return _Items(node_type, items2)
+
+
+def build_ast(regex_postfix):
+    """Построение синтаксического дерева по postfix-форме выражения"""
+    stack = []
+
+    for char in regex_postfix:
+        if char in [RegexConfig.ZERO_OR_MORE, RegexConfig.ONE_OR_MORE]:
+            if len(stack) < 1:
+                raise ValueError('Regex parsing error')
+            item = _get_node(stack.pop())
+            stack.append(Star(item) if char == RegexConfig.ZERO_OR_MORE else Plus(item))
+
+        elif char in [RegexConfig.AND, RegexConfig.OR]:
+            if len(stack) < 2:
+                raise ValueError('Regex parsing error')
+            item2 = stack.pop()
+            item1 = stack.pop()
+            stack.append(_join(Concat if char == RegexConfig.AND else Union, item1, item2))
+
+        else:
+            # [A-Za-z0-9] или класс символов
+            chars = get_symbol_chars(char)
+            if chars is None:
+                raise ValueError('Regex parsing error')
+            stack.append(Symbol(chars))
+
+    if len(stack) != 1:
+        raise ValueError('Regex parsing error')
+
+    return _get_node(stack.pop())
+
+
+def get_char_sets(node):
+    """Список множеств символов всех узлов Symbol дерева"""
+    char_sets = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Symbol):
+            char_sets.append(node.chars)
+        else:
+            stack.extend(reversed(get_children(node)))
+    return char_sets
+
+
+def is_nullable(node):
+    return node._nullable
+
+
+def _simplify_star(node):
+    item = node.item
+
+    # (a|ε)* = a*
+    if isinstance(item, Union):
+        items = [union_item for union_item in item.items if not isinstance(union_item, Epsilon)]
+        item = _simplify_union(Union(items))
+
+    if isinstance(item, (Star, Plus)):
+        item = item.item
+
+    if isinstance(item, Epsilon):
+        return item
+    return Star(item)
+
+
+def _simplify_plus(node):
+    item = node.item
+    if isinstance(item, Star):
+        return item
+    if isinstance(item, Plus):
+        item = item.item
+    if isinstance(item, Epsilon):
+        return item
+    if is_nullable(item):
+        return _simplify_star(Star(item))
+    return Plus(item)
+
+
+def _simplify_concat(node):
+    items = []
+    for item in _make_concat(node.items).items:
+        if isinstance(item, Epsilon):
+            continue
+
+        # a*a* = a*
+        if items and isinstance(item, Star) and item == items[-1]:
+            continue
+
+        items.append(item)
+
+    if len(items) == 0:
+        return Epsilon()
+    if len(items) == 1:
+        return items[0]
+    return Concat(items)
+
+
+def _get_sequence(node):
+    """Альтернатива как последовательность элементов конкатенации"""
+    return node.items if isinstance(node, Concat) else (node,)
+
+
+def _simplify_union(node):
+    # Удаление повторяющихся альтернатив с сохранением порядка
+    items = list(dict.fromkeys(_make_union(node.items).items))
+
+    # Вынесение общих префиксов: ab|ac = a(b|c). Общий префикс группы
+    # выносится целиком, поэтому глубина вызовов ограничена числом
+    # альтернатив, а не длиной префикса
+    groups = dict()
+    for item in items:
+        groups.setdefault(_get_sequence(item)[0], []).append(item)
+
+    if len(groups) < len(items):
+        items = []
+        for group in groups.values():
+            if len(group) == 1:
+                items.append(group[0])
+                continue
+
+            sequences = [_get_sequence(item) for item in group]
+            first = sequences[0]
+            length = min(len(sequence) for sequence in sequences)
+            prefix_length = 1
+            while prefix_length < length and \
+                    all(sequence[prefix_length] == first[prefix_length] for sequence in sequences[1:]):
+                prefix_length += 1
+
+            tails = [_simplify_concat(Concat(sequence[prefix_length:])) for sequence in sequences]
+            items.append(_simplify_concat(Concat(first[:prefix_length] + (_simplify_union(Union(tails)),))))
+        items = list(dict.fromkeys(_make_union(items).items))
+
+    # Объединение альтернатив из одного символа в множество символов
+    chars = set()
+    merged_items = []
+    for item in items:
+        if isinstance(item, Symbol):
+            if not chars:
+                merged_items.append(None)
+            chars |= item.chars
+        else:
+            merged_items.append(item)
+    items = [Symbol(chars) if item is None else item for item in merged_items]
+
+    # ε не нужна, если есть другая альтернатива, допускающая пустую цепочку
+    if any(isinstance(item, Epsilon) for item in items):
+        if any(is_nullable(item) for item in items if not isinstance(item, Epsilon)):
+            items = [item for item in items if not isinstance(item, Epsilon)]
+
+    if len(items) == 1:
+        return items[0]
+    return Union(items)
+
+
+def _simplify_node(node, items):
+    if isinstance(node, Star):
+        return _simplify_star(Star(items[0]))
+    if isinstance(node, Plus):
+        return _simplify_plus(Plus(items[0]))
+    if isinstance(node, Concat):
+        return _simplify_concat(Concat(items))
+    if isinstance(node, Union):
+        return _simplify_union(Union(items))
+    return node
+
+
+def simplify(node):
+    """Упрощение дерева: (a*)* = a*, a|a = a, a*a* = a*, объединение
+    альтернатив-символов в множество, вынесение общих префиксов"""
+    return reduce_tree(node, _simplify_node)
+
+
+def parse_regex(infix_regex_str):
+    """Построение упрощенного синтаксического дерева по выражению"""
+    return simplify(build_ast(prepare_regex(infix_regex_str)))
@@ -0,0 +1,60 @@
+import numpy as np
+
+from smc.matcher import DfaMatcher
+
+
+class BatchMatcher:
+    """
+    Одновременная проверка множества цепочек одним ДКА.
+    Цепочки кодируются в дополненную матрицу номеров столбцов, после
+    чего все цепочки продвигаются по таблице переходов на один символ
+    за шаг. Столбец дополнения оставляет состояние без изменений.
+    """
+
+    def __init__(self, matcher):
+        if not isinstance(matcher, DfaMatcher):
+            raise TypeError('Matcher must be DfaMatcher class member')
+
+        self.matcher = matcher
+        self.pad_column = matcher.width
+
+        # Таблица в номерах состояний, а не в смещениях строк
+        table = np.frombuffer(matcher.table, dtype=np.intc)
+        table = table.reshape(matcher.states_count, matcher.width) // matcher.width
+        identity = np.arange(matcher.states_count).reshape(-1, 1)
+        self.table = np.hstack([table, identity]).astype(np.intp)
+
+        self.init_state = matcher.init_state // matcher.width
+        self.dead_state = matcher.dead_state // matcher.width
+        self.accepting = np.frombuffer(bytes(matcher.accepting), dtype=np.uint8).astype(bool)
+
+        # Отображение кодов символов в номера столбцов,
+        # последний элемент соответствует символам не из алфавита
+        max_code = max((ord(char) for char in matcher.columns), default=0)
+        self.lookup = np.full(max_code + 2, matcher.unknown_column, dtype=np.intp)
+        for symbol, column in matcher.columns.items():
+            self.lookup[ord(symbol)] = column
+
+    def encode(self, chains):
+        """Кодирование цепочек в матрицу номеров столбцов и вектор длин"""
+        chains = list(chains)
+        lengths = np.fromiter((len(chain) for chain in chains), dtype=np.intp, count=len(chains))
+        max_length = int(lengths.max()) if len(chains) > 0 else 0
+
+        codes = np.frombuffer(''.join(chains).encode('utf-32-le'), dtype='<u4')
+        symbols = self.lookup[np.minimum(codes, len(self.lookup) - 1)]
+
+        matrix = np.full((len(chains), max_length), self.pad_column, dtype=np.intp)
+        matrix[np.arange(max_length) < lengths[:, None]] = symbols
+
+        return matrix, lengths
+
+    def match(self, chains):
+        """Получить вектор признаков допуска для каждой цепочки"""
+        matrix, lengths = self.encode(chains)
+
+        states = np.full(len(lengths), self.init_state, dtype=np.intp)
+        for i in range(matrix.shape[1]):
+            states = self.table[states, matrix[:, i]]
+
+        return self.accepting[states]
@@ -0,0 +1,93 @@
+from config import BaseConfig
+from smc.smc import StateMachine
+
+
+class BitNfa:
+    """
+    Моделирование НКА без построения ДКА. Множество текущих состояний
+    хранится битовой маской (int), переходы по символу вычисляются
+    байтами маски: для каждого байта заранее известна маска всех
+    состояний, достижимых из него по символу с учетом ε-замыкания.
+    """
+
+    CHUNK_BITS = 8
+    CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+    def __init__(self, nfa):
+        if not nfa or not isinstance(nfa, StateMachine):
+            raise TypeError('Nfa must be non empty StateMachine class member')
+
+        nfa._check_smc()
+
+        self.symbol_map = nfa.get_symbol_map()
+        self.bits = {state: bit for bit, state in enumerate(sorted(nfa.states))}
+
+        # ε-замыкание каждого состояния в виде маски
+        e_closures = nfa.get_e_closure_table()
+        closures = []
+        for state in sorted(nfa.states):
+            closures.append(self._to_mask(e_closures[state]))
+
+        self.start_mask = closures[self.bits[nfa.init_state]]
+        self.finish_mask = self._to_mask(nfa.finish_states)
+
+        # Маски последователей: символ -> бит состояния -> маска
+        successors = {symbol: dict() for symbol in nfa.language}
+        for start_state, end_state, symbol in nfa.transitions:
+            if symbol != BaseConfig.EPSILON:
+                bit = self.bits[start_state]
+                symbol_successors = successors[symbol]
+                symbol_successors[bit] = symbol_successors.get(bit, 0) | closures[self.bits[end_state]]
+        self.successors = successors
+
+        # Для каждого символа - байты маски, в которых есть переходы по нему.
+        # Таблицы на 256 значений байта заполняются по мере использования
+        self.steps = dict()
+        for symbol, symbol_successors in successors.items():
+            shifts = sorted({bit - bit % self.CHUNK_BITS for bit in symbol_successors})
+            self.steps[symbol] = [(shift, [None] * (self.CHUNK_MASK + 1)) for shift in shifts]
+
+    def _to_mask(self, states):
+        mask = 0
+        for state in states:
+            mask |= 1 << self.bits[state]
+        return mask
+
+    def _chunk_successors(self, symbol, shift, byte):
+        mask = 0
+        symbol_successors = self.successors[symbol]
+        for i in range(self.CHUNK_BITS):
+            if byte >> i & 1:
+                mask |= symbol_successors.get(shift + i, 0)
+        return mask
+
+    def _step_symbol(self, mask, symbol):
+        """Переход по символу НКА (представителю класса символов)"""
+        steps = self.steps.get(symbol)
+        if steps is None:
+            return 0
+
+        next_mask = 0
+        for shift, table in steps:
+            byte = (mask >> shift) & self.CHUNK_MASK
+            if byte:
+                chunk_mask = table[byte]
+                if chunk_mask is None:
+                    chunk_mask = table[byte] = self._chunk_successors(symbol, shift, byte)
+                next_mask |= chunk_mask
+
+        return next_mask
+
+    def step(self, mask, char):
+        """Получить маску состояний после перехода по символу char"""
+        return self._step_symbol(mask, self.symbol_map.get(char, char))
+
+    def matches(self, chain):
+        symbol_map = self.symbol_map
+        mask = self.start_mask
+        for char in chain:
+            mask = self._step_symbol(mask, symbol_map.get(char, char))
+            if mask == 0:
+                return False
+
+        return mask & self.finish_mask != 0
@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+
+from config import MatcherConfig
+from smc.dfa import DfaNfa
+from smc.nfa import NfaRegex
+
+
+def build_dfa(regex):
+    """Построение минимального ДКА по выражению"""
+    nfa = NfaRegex(regex)
+    nfa.build()
+    dfa = DfaNfa(nfa.nfa)
+    dfa.build()
+    dfa.minimize()
+    return dfa
+
+
+def compile_regex(regex):
+    """Построение минимального ДКА по выражению и его компиляция в таблицу"""
+    return build_dfa(regex).compile()
+
+
+class PatternCache:
+    """
+    Кэш скомпилированных выражений с вытеснением давно не
+    использованных (LRU). Ведется статистика попаданий, промахов
+    и вытеснений.
+    """
+
+    def __init__(self, maxsize=None):
+        if maxsize is None:
+            maxsize = MatcherConfig.PATTERN_CACHE_SIZE
+
+        self._check_maxsize(maxsize)
+
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _check_maxsize(maxsize):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('Cache size must be positive int')
+
+    def _evict(self):
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, regex):
+        with self._lock:
+            matcher = self.cache.get(regex)
+            if matcher is not None:
+                self.cache.move_to_end(regex)
+                self.hits += 1
+                return matcher
+            self.misses += 1
+
+        # Компиляция выполняется без блокировки, ошибки выражения не кэшируются
+        matcher = compile_regex(regex)
+
+        with self._lock:
+            self.cache[regex] = matcher
+            self.cache.move_to_end(regex)
+            self._evict()
+
+        return matcher
+
+    def resize(self, maxsize):
+        self._check_maxsize(maxsize)
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'size': len(self.cache),
+                    'maxsize': self.maxsize}
+
+
+pattern_cache = PatternCache()
+
+
+def compile(regex):
+    """Получить скомпилированный автомат для выражения из общего кэша процесса"""
+    return pattern_cache.get(regex)
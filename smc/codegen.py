@@ -0,0 +1,170 @@
+import hashlib
+import importlib.util
+import os
+
+from config import MatcherConfig
+from smc.cache import build_dfa
+from smc.smc import StateMachine
+from smc.storage import write_file
+from utils import get_intervals
+
+# Интервал из стольких символов и более проверяется сравнением границ
+MIN_RANGE_LENGTH = 3
+# Наибольшее число символов, проверяемых вхождением в строку
+MAX_STRING_LENGTH = 4
+# Наибольшее число состояний, выбираемых цепочкой сравнений; для
+# большего числа состояний ветвь выбирается делением пополам
+MAX_CHAIN_STATES = 4
+
+
+class _SourceBuilder:
+    def __init__(self, dfa, function_name):
+        self.dfa = dfa
+        self.function_name = function_name
+        self.lines = []
+        self.constants = []  # множества символов, передаваемые аргументами по умолчанию
+
+        states = sorted(dfa.states)
+        self.indices = {state: index for index, state in enumerate(states)}
+
+        # Символы переходов из каждого состояния, сгруппированные по состояниям перехода
+        self.moves = [dict() for _ in states]
+        for start_state, end_state, symbol in dfa.transitions:
+            state_moves = self.moves[self.indices[start_state]]
+            state_moves.setdefault(self.indices[end_state], set()).update(dfa.get_symbol_chars(symbol))
+
+    def _get_condition(self, chars):
+        """Условие на переменную char, истинное для символов chars"""
+        intervals = get_intervals(chars)
+        if len(chars) == 1:
+            return 'char == {!r}'.format(next(iter(chars)))
+
+        if len(intervals) == 1 and len(chars) >= MIN_RANGE_LENGTH:
+            return '{!r} <= char <= {!r}'.format(intervals[0][0], intervals[0][1])
+
+        if len(chars) <= MAX_STRING_LENGTH:
+            return 'char in {!r}'.format(''.join(sorted(chars)))
+
+        # Множество символов проверяется одним обращением к хэш-таблице
+        name = '_chars{}'.format(len(self.constants))
+        self.constants.append((name, ''.join(sorted(chars))))
+        return 'char in {}'.format(name)
+
+    def _add_state(self, index, indent):
+        state_moves = self.moves[index]
+        # Сначала проверяются переходы по большему числу символов
+        targets = sorted(state_moves, key=lambda target: (-len(state_moves[target]), target))
+        for i, target in enumerate(targets):
+            self.lines.append('{}{} {}:'.format(indent, 'if' if i == 0 else 'elif',
+                                                self._get_condition(state_moves[target])))
+            # В петле состояние не меняется
+            self.lines.append(indent + ('    pass' if target == index else '    state = {}'.format(target)))
+
+        if targets:
+            self.lines.append(indent + 'else:')
+            self.lines.append(indent + '    return False')
+        else:
+            self.lines.append(indent + 'return False')
+
+    def _add_states(self, first, last, indent):
+        """Ветви для состояний с номерами от first до last включительно"""
+        if last - first + 1 <= MAX_CHAIN_STATES:
+            for index in range(first, last + 1):
+                if index == first:
+                    self.lines.append('{}if state == {}:'.format(indent, index))
+                elif index < last:
+                    self.lines.append('{}elif state == {}:'.format(indent, index))
+                else:
+                    self.lines.append(indent + 'else:')
+                self._add_state(index, indent + '    ')
+            return
+
+        middle = (first + last + 1) // 2
+        self.lines.append('{}if state < {}:'.format(indent, middle))
+        self._add_states(first, middle - 1, indent + '    ')
+        self.lines.append(indent + 'else:')
+        self._add_states(middle, last, indent + '    ')
+
+    def build(self):
+        self.lines.append('    state = {}'.format(self.indices[self.dfa.init_state]))
+        self.lines.append('    for char in chain:')
+        if len(self.moves) == 1:
+            self._add_state(0, ' ' * 8)
+        else:
+            self._add_states(0, len(self.moves) - 1, ' ' * 8)
+
+        finish_indices = sorted(self.indices[state] for state in self.dfa.finish_states)
+        if len(finish_indices) == 0:
+            self.lines.append('    return False')
+        elif len(finish_indices) == 1:
+            self.lines.append('    return state == {}'.format(finish_indices[0]))
+        else:
+            self.lines.append('    return state in {}'.format(set(finish_indices)))
+
+        # Множества символов - аргументы по умолчанию, то есть локальные переменные функции
+        arguments = ['chain'] + ['{}=frozenset({!r})'.format(name, chars) for name, chars in self.constants]
+        header = 'def {}({}):'.format(self.function_name, ', '.join(arguments))
+        return '\n'.join([header] + self.lines) + '\n'
+
+
+def generate_source(dfa, function_name='match'):
+    """
+    Генерация исходного кода функции function_name(chain) на Python,
+    проверяющей цепочку по ДКА. Каждому состоянию соответствует ветвь
+    с проверками только тех символов, по которым из него есть переходы,
+    переходы в тупиковое состояние заменяются возвратом False.
+    """
+    if not dfa or not isinstance(dfa, StateMachine):
+        raise TypeError('Dfa must be non empty StateMachine class member')
+
+    if dfa.init_state is None:
+        raise ValueError('Init state is None')
+
+    return _SourceBuilder(dfa, function_name).build()
+
+
+def build_function(dfa, function_name='match'):
+    """Компиляция сгенерированного кода ДКА в функцию"""
+    namespace = dict()
+    code = compile(generate_source(dfa, function_name), '<dfa {}>'.format(function_name), 'exec')
+    exec(code, namespace)
+    return namespace[function_name]
+
+
+class CodegenCache:
+    """
+    Кэш сгенерированных функций в каталоге на диске. Код каждого
+    выражения записывается в отдельный модуль, при повторной загрузке
+    интерпретатор использует его байт-код из __pycache__.
+    """
+
+    FUNCTION_NAME = 'match'
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = os.path.join(MatcherConfig.disk_cache_dir, 'codegen')
+
+        self.directory = directory
+
+    def get_path(self, regex):
+        key = '{}:{}:{}'.format(MatcherConfig.ENGINE_VERSION, MatcherConfig.CODEGEN_VERSION, regex)
+        return os.path.join(self.directory, 'dfa_' + hashlib.sha256(key.encode('utf-8')).hexdigest() + '.py')
+
+    def _load(self, path):
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, self.FUNCTION_NAME)
+
+    def get(self, regex):
+        path = self.get_path(regex)
+        if os.path.exists(path):
+            try:
+                return self._load(path)
+            except (SyntaxError, AttributeError):
+                pass
+
+        source = '# {}\n'.format(regex) + generate_source(build_dfa(regex).dfa, self.FUNCTION_NAME)
+        write_file(path, source.encode('utf-8'))
+        return self._load(path)
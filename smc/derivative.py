@@ -0,0 +1,251 @@
+from collections import deque
+
+from config import RegexConfig
+from utils import check_regex_symbols, get_symbol_chars, prepare_regex
+
+
+class Term:
+    """
+    Узел регулярного выражения. Узлы создаются только через
+    DerivativeMatcher и не повторяются, поэтому сравниваются по
+    ссылке. В узле сохраняются уже вычисленные производные.
+    """
+
+    __slots__ = ('kind', 'args', 'nullable', 'derivatives')
+
+    EMPTY = 'empty'
+    EPSILON = 'epsilon'
+    SYMBOL = 'symbol'
+    CONCAT = 'concat'
+    UNION = 'union'
+    STAR = 'star'
+
+    def __init__(self, kind, args, nullable):
+        self.kind = kind
+        self.args = args
+        self.nullable = nullable
+        self.derivatives = dict()
+
+
+class _Operands:
+    """Операнды строящейся конкатенации или объединения"""
+
+    __slots__ = ('kind', 'terms')
+
+    def __init__(self, kind, terms):
+        self.kind = kind
+        self.terms = terms
+
+
+class DerivativeMatcher:
+    """
+    Проверка цепочек производными Бжозовского. Производная выражения
+    по символу строится при первом обращении и запоминается в узле,
+    поэтому достигнутые выражения служат состояниями ДКА, который
+    строится лениво и переиспользуется между вызовами.
+    """
+
+    def __init__(self, regex_infix):
+        if not check_regex_symbols(regex_infix):
+            raise ValueError('Unacceptable symbols in regex')
+
+        self.regex_infix = regex_infix
+        self.regex_postfix = None
+        self.start = None
+
+        self._terms = dict()
+        self.empty = self._make(Term.EMPTY, (), False)
+        self.epsilon = self._make(Term.EPSILON, (), True)
+
+    def _make(self, kind, args, nullable):
+        key = (kind, args)
+        term = self._terms.get(key)
+        if term is None:
+            term = self._terms[key] = Term(kind, args, nullable)
+        return term
+
+    def _symbol(self, chars):
+        return self._make(Term.SYMBOL, frozenset(chars), False)
+
+    def _concat(self, term1, term2):
+        if term1 is self.empty or term2 is self.empty:
+            return self.empty
+        if term1 is self.epsilon:
+            return term2
+        if term2 is self.epsilon:
+            return term1
+
+        # (r s) t -> r (s t): элементы левого операнда присоединяются
+        # к правому справа налево, без рекурсии
+        heads = []
+        while term1.kind == Term.CONCAT:
+            heads.append(term1.args[0])
+            term1 = term1.args[1]
+        heads.append(term1)
+
+        result = term2
+        for head in reversed(heads):
+            result = self._make(Term.CONCAT, (head, result), head.nullable and result.nullable)
+        return result
+
+    def _concat_all(self, terms):
+        """Конкатенация списка выражений, строится справа налево"""
+        result = self.epsilon
+        for term in reversed(terms):
+            result = self._concat(term, result)
+        return result
+
+    def _union_all(self, terms):
+        args = set()
+        for term in terms:
+            if term.kind == Term.UNION:
+                args.update(term.args)
+            elif term is not self.empty:
+                args.add(term)
+
+        if len(args) == 0:
+            return self.empty
+        if len(args) == 1:
+            return args.pop()
+
+        args = frozenset(args)
+        nullable = any(term.nullable for term in args)
+        return self._make(Term.UNION, args, nullable)
+
+    def _union(self, term1, term2):
+        return self._union_all([term1, term2])
+
+    def _star(self, term):
+        if term is self.empty or term is self.epsilon:
+            return self.epsilon
+        if term.kind == Term.STAR:
+            return term
+        return self._make(Term.STAR, term, True)
+
+    def _get_term(self, item):
+        if isinstance(item, _Operands):
+            return self._concat_all(item.terms) if item.kind == Term.CONCAT else self._union_all(item.terms)
+        return item
+
+    def _join(self, kind, item1, item2):
+        """Операнды n-арной операции собираются в списке, выражение
+        строится один раз, когда оно становится операндом другой операции"""
+        terms = []
+        for item in [item1, item2]:
+            if isinstance(item, _Operands) and item.kind == kind:
+                terms.append(item.terms)
+            else:
+                terms.append(deque([self._get_term(item)]))
+
+        # Меньший список добавляется к большему
+        if len(terms[0]) >= len(terms[1]):
+            terms[0].extend(terms[1])
+            return _Operands(kind, terms[0])
+        terms[1].extendleft(reversed(terms[0]))
+        return _Operands(kind, terms[1])
+
+    def _build_term(self, regex_postfix):
+        stack = []
+
+        for char in regex_postfix:
+            if char == RegexConfig.ZERO_OR_MORE:
+                if len(stack) < 1:
+                    raise ValueError('Regex parsing error')
+                stack.append(self._star(self._get_term(stack.pop())))
+
+            elif char == RegexConfig.ONE_OR_MORE:
+                if len(stack) < 1:
+                    raise ValueError('Regex parsing error')
+                term = self._get_term(stack.pop())
+                stack.append(self._concat(term, self._star(term)))
+
+            elif char in [RegexConfig.AND, RegexConfig.OR]:
+                if len(stack) < 2:
+                    raise ValueError('Regex parsing error')
+                item2 = stack.pop()
+                item1 = stack.pop()
+                stack.append(self._join(Term.CONCAT if char == RegexConfig.AND else Term.UNION, item1, item2))
+
+            else:
+                # [A-Za-z0-9] или класс символов
+                chars = get_symbol_chars(char)
+                if chars is None:
+                    raise ValueError('Regex parsing error')
+                stack.append(self._symbol(chars))
+
+        if len(stack) != 1:
+            raise ValueError('Regex parsing error')
+
+        return self._get_term(stack.pop())
+
+    def build(self):
+        self.regex_postfix = prepare_regex(self.regex_infix)
+        self.start = self._build_term(self.regex_postfix)
+
+    @staticmethod
+    def _get_derivative_args(term):
+        """Подвыражения, производные которых нужны для производной term"""
+        if term.kind == Term.CONCAT:
+            head, tail = term.args
+            return (head, tail) if head.nullable else (head,)
+        if term.kind == Term.UNION:
+            return term.args
+        if term.kind == Term.STAR:
+            return (term.args,)
+        return ()
+
+    def _get_derivative(self, term, char):
+        """Производная term по уже вычисленным производным подвыражений"""
+        if term.kind in [Term.EMPTY, Term.EPSILON]:
+            return self.empty
+        if term.kind == Term.SYMBOL:
+            return self.epsilon if char in term.args else self.empty
+        if term.kind == Term.CONCAT:
+            head, tail = term.args
+            result = self._concat(head.derivatives[char], tail)
+            if head.nullable:
+                result = self._union(result, tail.derivatives[char])
+            return result
+        if term.kind == Term.UNION:
+            return self._union_all([arg.derivatives[char] for arg in term.args])
+        return self._concat(term.args.derivatives[char], term)
+
+    def derivative(self, term, char):
+        """Получить производную выражения term по символу char"""
+        result = term.derivatives.get(char)
+        if result is not None:
+            return result
+
+        # Производные подвыражений вычисляются раньше производной
+        # выражения; обход идет по явному стеку, а не рекурсией
+        stack = [term]
+        while stack:
+            current = stack[-1]
+            if char in current.derivatives:
+                stack.pop()
+                continue
+
+            args = [arg for arg in self._get_derivative_args(current) if char not in arg.derivatives]
+            if args:
+                stack.extend(args)
+                continue
+
+            stack.pop()
+            current.derivatives[char] = self._get_derivative(current, char)
+
+        return term.derivatives[char]
+
+    def matches(self, chain):
+        if self.start is None:
+            raise TypeError('Use build() first')
+
+        term = self.start
+        for char in chain:
+            term = self.derivative(term, char)
+            if term is self.empty:
+                return False
+
+        return term.nullable
+
+    def get_terms_count(self):
+        return len(self._terms)
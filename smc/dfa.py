@@ -1,7 +1,7 @@
-import copy
+from collections import deque
 
+from smc.matcher import DfaMatcher
 from smc.smc import StateMachine
-from utils import get_dict_value_by_key
 
 
 class DfaNfa:
@@ -11,114 +11,220 @@ class DfaNfa:
         if not nfa or not isinstance(nfa, StateMachine):
             raise TypeError('Nfa must be non empty StateMachine class member')
 
-        self.dfa = None
+        self._reset_dfa()
 
     def _reset_dfa(self):
+        """Атрибуты построенного автомата. Задаются только здесь, метод
+        вызывается из __init__ DfaNfa и наследников"""
         self.dfa = None
+        self._matcher = None
+
+    def _add_finish_state(self, dfa_state, nfa_states):
+        """Отметить состояние ДКА принимающим вместе с метками
+        принимающих состояний НКА, входящих в него"""
+        self.dfa.add_finish_state(dfa_state)
+        for label in self.nfa.get_finish_labels(nfa_states):
+            self.dfa.add_finish_state(dfa_state, label)
 
     def build(self):
         self._reset_dfa()
         self.dfa = StateMachine()
         self.dfa.language = self.nfa.language
+        self.dfa.symbol_classes = self.nfa.symbol_classes
         self.dfa.add_init_state(0)
 
-        dfa_states = dict()
-        unmarked_queue = []  # очередь с помеченными состояниями ДКА
-        marked_queue = []
-        start_state_list = self.nfa.get_e_closure(self.nfa.init_state)
-        unmarked_queue.append(start_state_list)
+        nfa_finish_states = set(self.nfa.finish_states)
+        e_closures = self.nfa.get_e_closure_table()
 
-        dfa_states[0] = start_state_list
-        dfa_state_num = 1
+        # Множество состояний НКА -> номер состояния ДКА
+        start_states = e_closures[self.nfa.init_state]
+        dfa_states = {start_states: 0}
+        unmarked_queue = deque([start_states])  # очередь с непомеченными состояниями ДКА
 
-        while len(unmarked_queue) > 0:
-            start_state_list = unmarked_queue.pop()
-            marked_queue.append(start_state_list)
+        if not nfa_finish_states.isdisjoint(start_states):
+            self._add_finish_state(0, start_states)
+
+        while unmarked_queue:
+            start_states = unmarked_queue.popleft()
+            start_state = dfa_states[start_states]
             for symbol in self.dfa.language:
-                move_list = self.nfa.get_move_list(start_state_list, symbol)
-                end_state_list = self.nfa.get_e_closure_list(move_list)
+                move_list = self.nfa.get_move_list(list(start_states), symbol)
+                if move_list is None:
+                    continue
 
-                if end_state_list is not None and end_state_list not in marked_queue:
-                    unmarked_queue.append(end_state_list)
-                    dfa_states[dfa_state_num] = end_state_list
-                    dfa_state_num += 1
+                end_states = frozenset().union(*(e_closures[state] for state in move_list))
+                end_state = dfa_states.get(end_states)
+                if end_state is None:
+                    end_state = len(dfa_states)
+                    dfa_states[end_states] = end_state
+                    unmarked_queue.append(end_states)
 
-                # Переход в ДКА
-                start_state = get_dict_value_by_key(dfa_states, start_state_list)
-                end_state = get_dict_value_by_key(dfa_states, end_state_list)
-                if start_state is not None and end_state is not None:
-                    self.dfa.add_transition(start_state, end_state, symbol)
+                    if not nfa_finish_states.isdisjoint(end_states):
+                        self._add_finish_state(end_state, end_states)
 
-                    for state in end_state_list:
-                        if state in self.nfa.finish_states:
-                            self.dfa.add_finish_state(end_state)
+                # Переход в ДКА
+                self.dfa.add_transition(start_state, end_state, symbol)
 
     def minimize(self):
+        """
+        Минимизация ДКА алгоритмом Хопкрофта. Отсутствующие переходы
+        ведут в дополнительное тупиковое состояние, которое вместе с
+        эквивалентными ему состояниями удаляется из результата.
+        Принимающие состояния с разными множествами меток не объединяются.
+        Состояния результата нумеруются в порядке наименьших номеров
+        состояний исходного ДКА, входящих в класс.
+        """
         if self.dfa is None:
             raise TypeError('Use build() first')
 
-        dfa_classes = []
-        classes_queue = []
-
-        # Начальное разбиение
-        finish_states = self.dfa.finish_states
-        without_finish_states = list(set(self.dfa.states) - set(finish_states))
-
-        dfa_classes.append(finish_states)
-        dfa_classes.append(without_finish_states)
-        classes_queue.append(finish_states)
-        classes_queue.append(without_finish_states)
+        self._matcher = None
+
+        states = sorted(self.dfa.states)
+        indices = {state: index for index, state in enumerate(states)}
+        dead_index = len(states)
+        states_count = len(states) + 1
+
+        # Обратные переходы: символ -> состояние -> список состояний, из которых есть переход
+        inverse = dict()
+        for symbol in self.dfa.language:
+            symbol_inverse = [[] for _ in range(states_count)]
+            for index, state in enumerate(states):
+                move = self.dfa.get_move(state, symbol)
+                end_index = indices[move[0]] if move is not None else dead_index
+                symbol_inverse[end_index].append(index)
+            symbol_inverse[dead_index].append(dead_index)
+            inverse[symbol] = symbol_inverse
+
+        # Начальное разбиение: принимающие состояния по множествам меток и остальные
+        finish_indices = {indices[state] for state in self.dfa.finish_states}
+        finish_classes = dict()
+        for state in self.dfa.finish_states:
+            finish_classes.setdefault(self.dfa.get_finish_labels([state]), set()).add(indices[state])
+        classes = list(finish_classes.values()) + [set(range(states_count)) - finish_indices]
+        classes = [dfa_class for dfa_class in classes if dfa_class]
+        class_of = [0] * states_count
+        for class_id, dfa_class in enumerate(classes):
+            for index in dfa_class:
+                class_of[index] = class_id
+
+        # В очередь помещаются все классы начального разбиения, кроме наибольшего
+        largest_id = max(range(len(classes)), key=lambda class_id: len(classes[class_id]))
+        classes_queue = [class_id for class_id in range(len(classes)) if class_id != largest_id]
+        in_queue = set(classes_queue)
 
         # Поиск эквивалентных классов состояний
         while classes_queue:
-            curr_queue_item = classes_queue.pop()
+            splitter_id = classes_queue.pop()
+            in_queue.discard(splitter_id)
+            splitter = list(classes[splitter_id])
+
             for symbol in self.dfa.language:
-                # Список состояний, в которых есть переход в состояния из curr_queue_item
-                # по символу symbol
-                curr_end_list = self.dfa.get_come_list(curr_queue_item, symbol)
-                if curr_end_list is not None:
-
-                    dfa_classes_frozen = copy.deepcopy(dfa_classes)
-                    for curr_dfa_class in dfa_classes_frozen:
-                        intersection = set(curr_end_list) & set(curr_dfa_class)
-                        subtraction = set(curr_dfa_class) - set(curr_end_list)
-
-                        if len(intersection) > 0 and len(subtraction) > 0:
-                            index = dfa_classes.index(curr_dfa_class)
-                            dfa_classes.pop(index)
-                            dfa_classes.append(list(intersection))
-                            dfa_classes.append(list(subtraction))
-
-                            if curr_dfa_class in classes_queue:
-                                index = classes_queue.index(curr_dfa_class)
-                                classes_queue.pop(index)
-                                classes_queue.append(list(intersection))
-                                classes_queue.append(list(subtraction))
-                            else:
-                                if len(intersection) <= len(subtraction):
-                                    classes_queue.append(list(intersection))
-                                else:
-                                    classes_queue.append(list(subtraction))
-
-        for dfa_class in dfa_classes:
-            if len(dfa_class) > 1:
-                self.dfa.combine_states(dfa_class)
+                symbol_inverse = inverse[symbol]
+
+                # Состояния, из которых есть переход в splitter по символу symbol,
+                # сгруппированные по классам
+                touched = dict()
+                for index in splitter:
+                    for start_index in symbol_inverse[index]:
+                        touched.setdefault(class_of[start_index], []).append(start_index)
+
+                for class_id, intersection in touched.items():
+                    dfa_class = classes[class_id]
+                    if len(intersection) == len(dfa_class):
+                        continue
+
+                    new_class_id = len(classes)
+                    dfa_class.difference_update(intersection)
+                    classes.append(set(intersection))
+                    for index in intersection:
+                        class_of[index] = new_class_id
+
+                    if class_id in in_queue:
+                        classes_queue.append(new_class_id)
+                        in_queue.add(new_class_id)
+                    else:
+                        smaller_id = new_class_id if len(intersection) <= len(dfa_class) else class_id
+                        classes_queue.append(smaller_id)
+                        in_queue.add(smaller_id)
+
+        # Построение ДКА по классам эквивалентности
+        init_class_id = class_of[indices[self.dfa.init_state]]
+        dead_class_id = class_of[dead_index]
+        kept_classes = [class_id for class_id, dfa_class in enumerate(classes)
+                        if class_id != dead_class_id or class_id == init_class_id]
+        kept_classes.sort(key=lambda class_id: min(classes[class_id]))
+        new_states = {class_id: new_state for new_state, class_id in enumerate(kept_classes)}
+
+        dfa = StateMachine()
+        dfa.add_init_state(new_states[init_class_id])
+
+        transitions = []
+        for class_id in kept_classes:
+            index = min(classes[class_id] - {dead_index})
+            for symbol in self.dfa.language:
+                move = self.dfa.get_move(states[index], symbol)
+                if move is not None:
+                    end_class_id = class_of[indices[move[0]]]
+                    if end_class_id in new_states:
+                        transitions.append([new_states[class_id], new_states[end_class_id], symbol])
+
+        for transition in sorted(transitions):
+            dfa.add_transition(transition[0], transition[1], transition[2])
+
+        for class_id in kept_classes:
+            index = min(classes[class_id])
+            if index in finish_indices:
+                dfa.add_finish_state(new_states[class_id])
+                for label in self.dfa.get_finish_labels([states[index]]):
+                    dfa.add_finish_state(new_states[class_id], label)
+
+        dfa.states = sorted(new_states.values())
+        dfa.finish_states = sorted(dfa.finish_states)
+        dfa.language = self.dfa.language
+        dfa.symbol_classes = self.dfa.symbol_classes
+        self.dfa = dfa
+
+    def compile(self):
+        """Построение таблицы переходов ДКА для быстрой проверки цепочек"""
+        if self.dfa is None:
+            raise TypeError('Use build() first')
+
+        return DfaMatcher(self.dfa)
+
+    def matches(self, chain):
+        """Проверка цепочки без вывода информации и отрисовки автоматов"""
+        if self._matcher is None:
+            self._matcher = self.compile()
+
+        return self._matcher.match(chain)
+
+    def match_many(self, chains):
+        """Проверка последовательности цепочек, результат для каждой
+        цепочки выдается по мере обработки"""
+        if self._matcher is None:
+            self._matcher = self.compile()
+
+        match = self._matcher.match
+        for chain in chains:
+            yield match(chain)
 
     def run(self, chain):
         if self.dfa is None:
             raise TypeError('Use build() first')
 
-        self.nfa.draw()
+        if self.nfa is not None:
+            self.nfa.draw()
         self.dfa.draw()
         self.dfa.debug_print_info()
 
         print('Входная строка: ', chain)
+        symbol_map = self.dfa.get_symbol_map()
         is_valid = True
         i = 0
         curr_state = self.dfa.init_state
         while is_valid and i < len(chain):
             print('Текущий символ: ', chain[i])
-            next_state = self.dfa.get_move(curr_state, chain[i])
+            next_state = self.dfa.get_move(curr_state, symbol_map.get(chain[i], chain[i]))
             if next_state is not None and len(next_state) == 1:
                 print('Переход: ', curr_state, '---> ', end='')
                 curr_state = next_state.pop()
@@ -0,0 +1,72 @@
+from collections import deque
+
+from smc.dfa import DfaNfa
+from smc.positions import RegexPositions
+from smc.smc import StateMachine
+from utils import check_regex_symbols, prepare_regex
+
+
+class DfaRegex(DfaNfa):
+    """
+    Построение ДКА непосредственно по выражению, без промежуточного НКА.
+    Состояние ДКА - множество позиций выражения, после чтения символов
+    которых может находиться автомат, переходы вычисляются по followpos.
+    Минимизация и проверка цепочек наследуются от DfaNfa.
+    """
+
+    def __init__(self, regex_infix):
+        if not check_regex_symbols(regex_infix):
+            raise ValueError('Unacceptable symbols in regex')
+
+        self.regex_infix = regex_infix
+        self.regex_postfix = None
+        self.nfa = None
+        self._reset_dfa()
+
+    def build(self):
+        self._reset_dfa()
+        self.regex_postfix = prepare_regex(self.regex_infix)
+        positions = RegexPositions(self.regex_postfix)
+
+        self.dfa = StateMachine()
+        self.dfa.add_init_state(0)
+        language = list(dict.fromkeys(symbol for symbols in positions.position_symbols for symbol in symbols))
+        for symbol, intervals in positions.symbol_classes.items():
+            self.dfa.add_symbol_class(symbol, intervals)
+
+        # Множество позиций -> номер состояния ДКА
+        start_positions = frozenset([0])
+        dfa_states = {start_positions: 0}
+        unmarked_queue = deque([start_positions])
+
+        if positions.nullable:
+            self.dfa.add_finish_state(0)
+
+        while unmarked_queue:
+            start_positions = unmarked_queue.popleft()
+            start_state = dfa_states[start_positions]
+
+            # Следующие позиции, сгруппированные по символам
+            moves = dict()
+            for position in start_positions:
+                for next_position in positions.follow[position]:
+                    for symbol in positions.position_symbols[next_position]:
+                        moves.setdefault(symbol, set()).add(next_position)
+
+            for symbol in language:
+                if symbol not in moves:
+                    continue
+
+                end_positions = frozenset(moves[symbol])
+                end_state = dfa_states.get(end_positions)
+                if end_state is None:
+                    end_state = len(dfa_states)
+                    dfa_states[end_positions] = end_state
+                    unmarked_queue.append(end_positions)
+
+                    if not positions.last.isdisjoint(end_positions):
+                        self.dfa.add_finish_state(end_state)
+
+                self.dfa.add_transition(start_state, end_state, symbol)
+
+        self.dfa.language = language
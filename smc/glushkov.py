@@ -0,0 +1,45 @@
+from smc.positions import RegexPositions
+from smc.smc import StateMachine
+from utils import check_regex_symbols, prepare_regex
+
+
+class GlushkovRegex:
+    """
+    Построение автомата позиций (Глушкова) без ε-переходов. Состояние 0 -
+    начальное, остальные состояния соответствуют вхождениям символов
+    в выражение. Переход в состояние позиции p идет по символам этой позиции.
+    """
+
+    def __init__(self, regex_infix):
+        if not check_regex_symbols(regex_infix):
+            raise ValueError('Unacceptable symbols in regex')
+
+        self.regex_infix = regex_infix
+        self.regex_postfix = None
+        self.nfa = None
+
+    def _reset_nfa(self):
+        self.nfa = None
+        self.regex_postfix = None
+
+    def build(self):
+        self._reset_nfa()
+        self.regex_postfix = prepare_regex(self.regex_infix)
+        positions = RegexPositions(self.regex_postfix)
+
+        sm = StateMachine()
+        sm.add_init_state(0)
+
+        for start_state, follow in enumerate(positions.follow):
+            for end_state in sorted(follow):
+                for symbol in positions.position_symbols[end_state]:
+                    sm.add_transition(start_state, end_state, symbol)
+
+        for state in range(len(positions.symbols)):
+            if positions.is_final(state):
+                sm.add_finish_state(state)
+
+        for symbol, intervals in positions.symbol_classes.items():
+            sm.add_symbol_class(symbol, intervals)
+
+        self.nfa = sm
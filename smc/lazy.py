@@ -0,0 +1,86 @@
+from collections import OrderedDict
+
+from config import MatcherConfig
+from smc.smc import StateMachine
+
+
+class LazyDfa:
+    """
+    ДКА, состояния которого строятся по мере чтения цепочки.
+    Состояние ДКА - множество состояний НКА (frozenset). Построенные
+    состояния и переходы из них хранятся в ограниченном кэше, при
+    заполнении кэша вытесняется давно не использованное состояние.
+    """
+
+    def __init__(self, nfa, cache_size=None):
+        if not nfa or not isinstance(nfa, StateMachine):
+            raise TypeError('Nfa must be non empty StateMachine class member')
+
+        if cache_size is None:
+            cache_size = MatcherConfig.LAZY_DFA_CACHE_SIZE
+
+        if not isinstance(cache_size, int) or cache_size < 1:
+            raise ValueError('Cache size must be positive int')
+
+        nfa._check_smc()
+
+        self.nfa = nfa
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.symbol_map = nfa.get_symbol_map()
+        self.finish_states = frozenset(nfa.finish_states)
+        self.e_closures = nfa.get_e_closure_table()
+        self.init_state = self.e_closures[nfa.init_state]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_transitions(self, state):
+        transitions = self.cache.get(state)
+        if transitions is None:
+            if len(self.cache) >= self.cache_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+            transitions = self.cache[state] = dict()
+        else:
+            self.cache.move_to_end(state)
+        return transitions
+
+    def _step_symbol(self, state, symbol):
+        """Переход по символу НКА (представителю класса символов)"""
+        transitions = self._get_transitions(state)
+        next_state = transitions.get(symbol)
+
+        if next_state is None:
+            self.misses += 1
+            move_list = self.nfa.get_move_list(list(state), symbol) or ()
+            next_state = frozenset().union(*(self.e_closures[end_state] for end_state in move_list))
+            transitions[symbol] = next_state
+        else:
+            self.hits += 1
+
+        return next_state
+
+    def step(self, state, char):
+        """Получить состояние ДКА после перехода по символу char"""
+        return self._step_symbol(state, self.symbol_map.get(char, char))
+
+    def is_accepting(self, state):
+        return not self.finish_states.isdisjoint(state)
+
+    def matches(self, chain):
+        symbol_map = self.symbol_map
+        state = self.init_state
+        for char in chain:
+            state = self._step_symbol(state, symbol_map.get(char, char))
+            if not state:
+                return False
+
+        return self.is_accepting(state)
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,117 @@
+from smc.regex_set import RegexSet
+
+
+class Token:
+    __slots__ = ('name', 'value', 'start', 'end')
+
+    def __init__(self, name, value, start, end):
+        self.name = name
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def __eq__(self, other):
+        return isinstance(other, Token) and (self.name, self.value, self.start, self.end) == \
+            (other.name, other.value, other.start, other.end)
+
+    def __repr__(self):
+        return 'Token({!r}, {!r}, {}, {})'.format(self.name, self.value, self.start, self.end)
+
+
+class Lexer:
+    """
+    Лексический анализатор по упорядоченному списку правил (имя, выражение).
+    Все правила объединяются в один минимизированный ДКА, состояние которого
+    допускает лексему правила с наименьшим номером среди своих меток.
+    Разбор идет по принципу самой длинной лексемы: входная строка читается
+    до тупикового состояния, запоминается позиция последнего допуска, и
+    следующая лексема начинается с нее.
+    """
+
+    def __init__(self, rules):
+        rules = list(rules)
+        names = []
+        for rule in rules:
+            if not isinstance(rule, tuple) or len(rule) != 2:
+                raise TypeError('Rule must be (name, regex) tuple')
+            if rule[0] in names:
+                raise ValueError('Duplicate rule name')
+            names.append(rule[0])
+
+        self.names = names
+        self.regex_set = RegexSet(regex for _, regex in rules)
+        self.matcher = None
+        self.accept_rules = None
+
+    def build(self):
+        self.regex_set.build()
+        self.matcher = self.regex_set.matcher
+
+        # Номер правила, допускаемого в каждом состоянии (по приоритету)
+        self.accept_rules = [min(labels) if labels else None for labels in self.matcher.labels]
+
+    def tokenize(self, text):
+        """Разбор строки на лексемы"""
+        return self.tokenize_stream([text])
+
+    def tokenize_stream(self, chunks):
+        """Разбор строки, поступающей по частям. В памяти хранится только
+        часть текущей лексемы, прочитанная до конца очередной части"""
+        if self.matcher is None:
+            raise TypeError('Use build() first')
+
+        table = self.matcher.table
+        columns = self.matcher.columns
+        unknown_column = self.matcher.unknown_column
+        dead_state = self.matcher.dead_state
+        width = self.matcher.width
+        init_state = self.matcher.init_state
+        accept_rules = self.accept_rules
+
+        chunks = iter(chunks)
+        is_finished = False
+        buffer = ''
+        offset = 0  # позиция начала буфера во входной строке
+        start = 0  # начало текущей лексемы в буфере
+        position = 0
+        state = init_state
+        last_end = None
+        last_rule = None
+
+        while True:
+            if position < len(buffer):
+                state = table[state + columns.get(buffer[position], unknown_column)]
+                position += 1
+                if state != dead_state:
+                    rule = accept_rules[state // width]
+                    if rule is not None:
+                        last_end, last_rule = position, rule
+                    continue
+
+            elif not is_finished:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    is_finished = True
+                else:
+                    # Прочитанные лексемы из буфера удаляются
+                    offset += start
+                    buffer = buffer[start:] + chunk
+                    position -= start
+                    if last_end is not None:
+                        last_end -= start
+                    start = 0
+                continue
+
+            elif start == len(buffer):
+                return
+
+            # Тупиковое состояние или конец входной строки
+            if last_rule is None:
+                raise ValueError('Unexpected symbol at position {}'.format(offset + start))
+
+            yield Token(self.names[last_rule], buffer[start:last_end], offset + start, offset + last_end)
+
+            start = position = last_end
+            state = init_state
+            last_end = None
+            last_rule = None
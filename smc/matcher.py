@@ -0,0 +1,162 @@
+from array import array
+
+from smc.smc import StateMachine
+
+
+class DfaMatcher:
+    """
+    Скомпилированный ДКА для быстрой проверки цепочек.
+    Символы алфавита отображаются в номера столбцов, переходы хранятся
+    в плоской таблице. Состояние задается смещением начала его строки
+    в таблице, отсутствующие переходы ведут в явное тупиковое состояние.
+    Столбец соответствует классу символов: alphabet содержит для каждого
+    столбца строку всех символов, переходы по которым в нем хранятся.
+    После построения таблица и признаки допуска доступны только для чтения.
+    """
+
+    def __init__(self, dfa):
+        if not dfa or not isinstance(dfa, StateMachine):
+            raise TypeError('Dfa must be non empty StateMachine class member')
+
+        if dfa.init_state is None:
+            raise ValueError('Init state is None')
+
+        self._set_alphabet(dfa.get_symbol_chars(symbol) for symbol in dfa.language)
+        symbol_columns = {symbol: column for column, symbol in enumerate(dfa.language)}
+
+        states = sorted(dfa.states)
+        indices = {state: index for index, state in enumerate(states)}
+        self.states_count = len(states) + 1
+        self.dead_state = len(states) * self.width
+
+        table = array('i', [self.dead_state]) * (self.states_count * self.width)
+        for start_state, end_state, symbol in dfa.transitions:
+            cell = indices[start_state] * self.width + symbol_columns[symbol]
+            if table[cell] != self.dead_state:
+                raise ValueError('State machine is not deterministic')
+            table[cell] = indices[end_state] * self.width
+        self.table = memoryview(table).toreadonly()
+
+        accepting = bytearray(self.states_count)
+        for state in dfa.finish_states:
+            accepting[indices[state]] = 1
+        self.accepting = bytes(accepting)
+
+        # Метки принимающих состояний (номера выражений), по индексу состояния
+        self.labels = tuple(dfa.get_finish_labels([state]) for state in states) + (frozenset(),)
+
+        self.init_state = indices[dfa.init_state] * self.width
+
+    def _set_alphabet(self, alphabet):
+        self.alphabet = tuple(alphabet)
+        # Последний столбец соответствует символам не из алфавита
+        self.width = len(self.alphabet) + 1
+        self.unknown_column = len(self.alphabet)
+        self.columns = {char: column for column, chars in enumerate(self.alphabet) for char in chars}
+
+    @classmethod
+    def from_table(cls, alphabet, table, init_state, accepting, labels=None):
+        """Создание по готовой таблице переходов (например, загруженной
+        из файла). Последнее состояние в accepting - тупиковое"""
+        matcher = cls.__new__(cls)
+        matcher._set_alphabet(alphabet)
+
+        if len(table) != len(accepting) * matcher.width:
+            raise ValueError('Table size does not match states count')
+
+        matcher.states_count = len(accepting)
+        matcher.dead_state = (matcher.states_count - 1) * matcher.width
+        matcher.table = table
+        matcher.accepting = bytes(accepting)
+        matcher.init_state = init_state
+
+        if labels is None:
+            labels = [frozenset()] * matcher.states_count
+        if len(labels) != matcher.states_count:
+            raise ValueError('Labels size does not match states count')
+        matcher.labels = tuple(frozenset(state_labels) for state_labels in labels)
+
+        return matcher
+
+    def is_accepting(self, state):
+        return self.accepting[state // self.width] == 1
+
+    def match(self, chain):
+        table = self.table
+        columns = self.columns
+        unknown_column = self.unknown_column
+        dead_state = self.dead_state
+
+        state = self.init_state
+        for char in chain:
+            state = table[state + columns.get(char, unknown_column)]
+            if state == dead_state:
+                return False
+
+        return self.accepting[state // self.width] == 1
+
+    def match_labels(self, chain):
+        """Получить множество меток принимающего состояния, достигнутого
+        после чтения цепочки (пустое, если цепочка не допускается)"""
+        table = self.table
+        columns = self.columns
+        unknown_column = self.unknown_column
+        dead_state = self.dead_state
+
+        state = self.init_state
+        for char in chain:
+            state = table[state + columns.get(char, unknown_column)]
+            if state == dead_state:
+                break
+
+        return self.labels[state // self.width]
+
+    def stream(self):
+        return StreamMatcher(self)
+
+
+class StreamMatcher:
+    """
+    Потоковая проверка цепочки, поступающей по частям.
+    Между вызовами feed() хранится только текущее состояние ДКА.
+    """
+
+    def __init__(self, matcher):
+        if not isinstance(matcher, DfaMatcher):
+            raise TypeError('Matcher must be DfaMatcher class member')
+
+        self.matcher = matcher
+        self.state = matcher.init_state
+
+    def feed(self, chunk):
+        """Обработка очередной части цепочки. Возвращает False, если
+        достигнуто тупиковое состояние и дальнейшие части не нужны"""
+        table = self.matcher.table
+        columns = self.matcher.columns
+        unknown_column = self.matcher.unknown_column
+        dead_state = self.matcher.dead_state
+
+        state = self.state
+        if state == dead_state:
+            return False
+
+        for char in chunk:
+            state = table[state + columns.get(char, unknown_column)]
+            if state == dead_state:
+                break
+
+        self.state = state
+        return state != dead_state
+
+    def is_dead(self):
+        return self.state == self.matcher.dead_state
+
+    def is_accepting(self):
+        return self.matcher.is_accepting(self.state)
+
+    def finish(self):
+        """Завершение цепочки. Возвращает результат проверки и
+        возвращает автомат в начальное состояние"""
+        result = self.is_accepting()
+        self.state = self.matcher.init_state
+        return result
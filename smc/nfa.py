@@ -1,8 +1,7 @@
-import copy
-
-from config import BaseConfig, RegexConfig
+from config import BaseConfig
+from regex_ast import Concat, Epsilon, Plus, Star, Symbol, build_ast, get_char_sets, reduce_tree, simplify
 from smc.smc import StateMachine
-from utils import check_regex_symbols, prepare_regex
+from utils import build_symbol_classes, check_regex_symbols, get_interval_chars, prepare_regex
 
 
 class NfaRegex:
@@ -12,140 +11,134 @@ class NfaRegex:
 
         self.regex_infix = regex_infix
         self.regex_postfix = None
+        self.regex_ast = None
         self.nfa = None
 
+        # Переходы строящегося автомата: состояние -> список (символ, состояние)
+        self._edges = []
+
+        # Классы эквивалентности символов выражения: символ перехода -> интервалы
+        self._symbol_classes = dict()
+        self._symbol_map = dict()
+
     def _reset_nfa(self):
         self.nfa = None
         self.regex_postfix = None
+        self.regex_ast = None
+        self._edges = []
+        self._symbol_classes = dict()
+        self._symbol_map = dict()
+
+    def _new_state(self):
+        state = len(self._edges)
+        self._edges.append([])
+        return state
+
+    def _build_basic_sm(self, chars):
+        start_state = self._new_state()
+        end_state = self._new_state()
+        for char in chars:
+            self._edges[start_state].append((char, end_state))
+        return start_state, end_state
+
+    def _build_epsilon_sm(self):
+        return self._build_basic_sm([BaseConfig.EPSILON])
+
+    def _build_and_sm(self, fragment1, fragment2):
+        # В начальное состояние фрагмента нет входящих переходов, поэтому
+        # оно объединяется с конечным состоянием предыдущего фрагмента
+        self._edges[fragment1[1]].extend(self._edges[fragment2[0]])
+        self._edges[fragment2[0]] = None
+        return fragment1[0], fragment2[1]
+
+    def _build_or_sm(self, fragments):
+        start_state = self._new_state()
+        end_state = self._new_state()
+
+        for fragment in fragments:
+            self._edges[start_state].append((BaseConfig.EPSILON, fragment[0]))
+            self._edges[fragment[1]].append((BaseConfig.EPSILON, end_state))
+
+        return start_state, end_state
+
+    def _build_zero_or_more_sm(self, fragment):
+        start_state = self._new_state()
+        end_state = self._new_state()
+
+        self._edges[start_state].append((BaseConfig.EPSILON, fragment[0]))
+        self._edges[start_state].append((BaseConfig.EPSILON, end_state))
+        self._edges[fragment[1]].append((BaseConfig.EPSILON, fragment[0]))
+        self._edges[fragment[1]].append((BaseConfig.EPSILON, end_state))
+
+        return start_state, end_state
+
+    def _build_one_or_more_sm(self, fragment):
+        start_state = self._new_state()
+        end_state = self._new_state()
+
+        self._edges[start_state].append((BaseConfig.EPSILON, fragment[0]))
+        self._edges[fragment[1]].append((BaseConfig.EPSILON, fragment[0]))
+        self._edges[fragment[1]].append((BaseConfig.EPSILON, end_state))
+
+        return start_state, end_state
+
+    def _build_sm(self, fragment):
+        """Построение автомата по фрагменту. Состояния нумеруются
+        подряд в порядке создания, объединенные состояния пропускаются"""
+        numbers = dict()
+        for state, edges in enumerate(self._edges):
+            if edges is not None:
+                numbers[state] = len(numbers)
 
-    @staticmethod
-    def _build_basic_sm(char):
         sm = StateMachine()
-        sm.add_init_state(0)
-        sm.add_finish_state(1)
-        sm.add_catch_state(1)
-        sm.add_transition(sm.init_state, sm.catch_state, char)
-        return sm
-
-    @staticmethod
-    def _build_and_sm(sm1, sm2):
-        sm = StateMachine()
-        sm.add_init_state(sm1.init_state)
-
-        for transition in sm1.transitions:
-            sm.add_transition(transition[0], transition[1], transition[2])
+        sm.add_init_state(numbers[fragment[0]])
 
-        if sm1.catch_state > 0:
-            sm2.renumber_states(sm1.catch_state - 1)
-        else:
-            sm2.renumber_states()
-
-        for transition in sm2.transitions:
-            sm.add_transition(transition[0], transition[1], transition[2])
-
-        sm.add_finish_state(sm2.catch_state)
-        sm.add_catch_state(sm2.catch_state)
-
-        return sm
-
-    @staticmethod
-    def _build_or_sm(sm1, sm2):
-        sm = StateMachine()
-        sm.add_init_state(0)
-        sm1.renumber_states()
-        sm2.renumber_states(from_number=sm1.catch_state)
-
-        sm.add_transition(sm.init_state, sm1.init_state, BaseConfig.EPSILON)
-        sm.add_transition(sm.init_state, sm2.init_state, BaseConfig.EPSILON)
-
-        for transition in sm1.transitions:
-            sm.add_transition(transition[0], transition[1], transition[2])
-
-        for transition in sm2.transitions:
-            sm.add_transition(transition[0], transition[1], transition[2])
-
-        sm.add_finish_state(sm2.catch_state + 1)
-        sm.add_catch_state(sm2.catch_state + 1)
-
-        sm.add_transition(sm1.catch_state, sm.catch_state, BaseConfig.EPSILON)
-        sm.add_transition(sm2.catch_state, sm.catch_state, BaseConfig.EPSILON)
+        for state, edges in enumerate(self._edges):
+            if edges is not None:
+                for symbol, end_state in edges:
+                    sm.add_transition(numbers[state], numbers[end_state], symbol)
 
+        sm.add_finish_state(numbers[fragment[1]])
+        sm.add_catch_state(numbers[fragment[1]])
         sm.states = sorted(sm.states)
 
-        return sm
+        for symbol, intervals in self._symbol_classes.items():
+            sm.add_symbol_class(symbol, intervals)
 
-    @staticmethod
-    def _build_zero_or_more_sm(sm1):
-        sm = StateMachine()
-        sm.add_init_state(0)
+        return sm
 
-        sm1.renumber_states()
-        sm1.add_transition(sm1.catch_state, sm1.init_state, BaseConfig.EPSILON)
+    def _build_node_fragment(self, node, fragments):
+        """Построение фрагмента автомата по узлу синтаксического дерева
+        и уже построенным фрагментам дочерних узлов"""
+        if isinstance(node, Symbol):
+            # Один переход на каждый класс символов, а не на каждый символ
+            return self._build_basic_sm(sorted({self._symbol_map[char] for char in node.chars}))
 
-        for transition in sm1.transitions:
-            sm.add_transition(transition[0], transition[1], transition[2])
+        if isinstance(node, Epsilon):
+            return self._build_epsilon_sm()
 
-        sm.add_finish_state(sm1.catch_state + 1)
-        sm.add_catch_state(sm1.catch_state + 1)
+        if isinstance(node, Star):
+            return self._build_zero_or_more_sm(fragments[0])
 
-        sm.add_transition(sm.init_state, sm1.init_state, BaseConfig.EPSILON)
-        sm.add_transition(sm.init_state, sm.catch_state, BaseConfig.EPSILON)
-        sm.add_transition(sm1.catch_state, sm.catch_state, BaseConfig.EPSILON)
+        if isinstance(node, Plus):
+            return self._build_one_or_more_sm(fragments[0])
 
-        sm.states = sorted(sm.states)
-        sm.transitions = sorted(sm.transitions)
-        return sm
+        if isinstance(node, Concat):
+            fragment = fragments[0]
+            for item_fragment in fragments[1:]:
+                fragment = self._build_and_sm(fragment, item_fragment)
+            return fragment
 
-    def _build_one_or_more_sm(self, sm1):
-        sm2 = self._build_zero_or_more_sm(copy.deepcopy(sm1))
-        sm = self._build_and_sm(sm1, sm2)
-        return sm
+        return self._build_or_sm(fragments)
 
     def build(self):
         self._reset_nfa()
         self.regex_postfix = prepare_regex(self.regex_infix)
+        self.regex_ast = simplify(build_ast(self.regex_postfix))
+
+        self._symbol_classes = build_symbol_classes(get_char_sets(self.regex_ast))
+        self._symbol_map = {char: symbol for symbol, intervals in self._symbol_classes.items()
+                            for char in get_interval_chars(intervals)}
 
-        sm_queue = []
-
-        for char in self.regex_postfix:
-            if char == RegexConfig.ZERO_OR_MORE:
-                if len(sm_queue) < 1:
-                    raise ValueError('Regex parsing error')
-                sm1 = sm_queue.pop()
-                sm = self._build_zero_or_more_sm(sm1)
-                sm_queue.append(sm)
-
-            elif char == RegexConfig.ONE_OR_MORE:
-                if len(sm_queue) < 1:
-                    raise ValueError('Regex parsing error')
-                sm1 = sm_queue.pop()
-                sm = self._build_one_or_more_sm(sm1)
-                sm_queue.append(sm)
-
-            elif char == RegexConfig.AND:
-                if len(sm_queue) < 2:
-                    raise ValueError('Regex parsing error')
-
-                sm2 = sm_queue.pop()
-                sm1 = sm_queue.pop()
-
-                sm = self._build_and_sm(sm1, sm2)
-                sm_queue.append(sm)
-
-            elif char == RegexConfig.OR:
-                if len(sm_queue) < 2:
-                    raise ValueError('Regex parsing error')
-
-                sm2 = sm_queue.pop()
-                sm1 = sm_queue.pop()
-                sm = self._build_or_sm(sm1, sm2)
-                sm_queue.append(sm)
-
-            # [A-Za-z0-9]
-            elif char in RegexConfig.VALID_SYMBOLS:
-                sm = self._build_basic_sm(char)
-                sm_queue.append(sm)
-            else:
-                raise ValueError('Regex parsing error')
-
-        self.nfa = sm_queue.pop()
+        self.nfa = self._build_sm(reduce_tree(self.regex_ast, self._build_node_fragment))
+        self._edges = []
@@ -0,0 +1,163 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from smc.cache import compile_regex
+from smc.matcher import DfaMatcher
+from smc.storage import dump_matcher, loads_matcher
+
+
+class CompileResult:
+    """Результат компиляции одного выражения: ДКА или ошибка"""
+
+    def __init__(self, pattern, matcher=None, error=None):
+        self.pattern = pattern
+        self.matcher = matcher
+        self.error = error
+
+    def __repr__(self):
+        if self.error is not None:
+            return 'CompileResult({!r}, error={!r})'.format(self.pattern, self.error)
+        return 'CompileResult({!r})'.format(self.pattern)
+
+
+def _compile_pattern(pattern):
+    """Компиляция выражения в процессе-исполнителе. В основной процесс
+    передается сериализованный ДКА, а не объекты StateMachine"""
+    try:
+        return dump_matcher(compile_regex(pattern)), None
+    except Exception as error:
+        return None, error
+
+
+def _get_result(pattern, data, error):
+    if error is not None:
+        return CompileResult(pattern, error=error)
+    return CompileResult(pattern, matcher=loads_matcher(data))
+
+
+def compile_many(patterns, workers=None):
+    """
+    Компиляция списка выражений в нескольких процессах. Результаты
+    возвращаются в порядке входного списка, ошибка в одном выражении
+    (например, ValueError при разборе) не прерывает компиляцию остальных.
+    При workers=1 выражения компилируются в текущем процессе.
+    """
+    patterns = list(patterns)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('Workers count must be positive int')
+
+    workers = min(workers, len(patterns))
+    if workers <= 1:
+        return [_get_result(pattern, *_compile_pattern(pattern)) for pattern in patterns]
+
+    # Выражения передаются исполнителям группами, чтобы уменьшить
+    # накладные расходы на обмен между процессами
+    chunksize = max(1, len(patterns) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        compiled = list(executor.map(_compile_pattern, patterns, chunksize=chunksize))
+
+    return [_get_result(pattern, data, error) for pattern, (data, error) in zip(patterns, compiled)]
+
+
+# ДКА, загруженный в процессе-исполнителе при его запуске
+_worker_matcher = None
+
+
+def _init_chunk_worker(data):
+    global _worker_matcher
+    _worker_matcher = loads_matcher(data)
+
+
+def get_chunk_mapping(matcher, chunk):
+    """
+    Получить отображение состояний ДКА после чтения части цепочки:
+    элемент i - состояние (смещение строки таблицы), в которое переходит
+    автомат из i-го состояния. Автомат запускается сразу из всех
+    состояний, совпавшие траектории объединяются.
+    """
+    table = matcher.table
+    columns = matcher.columns
+    unknown_column = matcher.unknown_column
+    dead_state = matcher.dead_state
+
+    # Различные текущие состояния и номер текущего состояния для каждого
+    # начального (-1, если автомат из этого состояния попал в тупиковое)
+    states = list(range(0, matcher.states_count * matcher.width, matcher.width))
+    owners = list(range(matcher.states_count))
+
+    position = 0
+    while position < len(chunk) and len(states) > 1:
+        column = columns.get(chunk[position], unknown_column)
+        states = [table[state + column] for state in states]
+        position += 1
+
+        unique_states = dict.fromkeys(states)
+        unique_states.pop(dead_state, None)
+        if len(unique_states) < len(states):
+            indices = {state: index for index, state in enumerate(unique_states)}
+            owners = [indices.get(states[owner], -1) if owner >= 0 else -1 for owner in owners]
+            states = list(unique_states)
+
+    # Все траектории совпали: остаток части читается как обычно
+    if len(states) == 1:
+        state = states[0]
+        for char in islice(chunk, position, None):
+            if state == dead_state:
+                break
+            state = table[state + columns.get(char, unknown_column)]
+        states = [state]
+
+    return array('i', (states[owner] if owner >= 0 else dead_state for owner in owners))
+
+
+def _get_worker_chunk_mapping(chunk):
+    return get_chunk_mapping(_worker_matcher, chunk)
+
+
+def run_parallel(matcher, text, workers=None, chunk_size=None):
+    """
+    Получить состояние ДКА после чтения цепочки text. Цепочка делится
+    на части, для каждой части в отдельном процессе строится отображение
+    состояний, затем отображения применяются по порядку к начальному
+    состоянию. Результат совпадает с последовательным чтением цепочки.
+    """
+    if not isinstance(matcher, DfaMatcher):
+        raise TypeError('Matcher must be DfaMatcher class member')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('Workers count must be positive int')
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(text) // workers))
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('Chunk size must be positive int')
+
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        mappings = [get_chunk_mapping(matcher, chunk) for chunk in chunks]
+    else:
+        # Таблица переходов передается исполнителю один раз при запуске
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_chunk_worker,
+                                 initargs=(dump_matcher(matcher),)) as executor:
+            mappings = list(executor.map(_get_worker_chunk_mapping, chunks))
+
+    state = matcher.init_state
+    for mapping in mappings:
+        state = mapping[state // matcher.width]
+
+    return state
+
+
+def match_parallel(matcher, text, workers=None, chunk_size=None):
+    """Проверка цепочки чтением ее частей в нескольких процессах"""
+    return matcher.is_accepting(run_parallel(matcher, text, workers, chunk_size))
@@ -0,0 +1,91 @@
+from config import RegexConfig
+from utils import build_symbol_classes, get_interval_chars, get_symbol_chars
+
+
+class RegexPositions:
+    """
+    Позиции символов регулярного выражения и функции nullable,
+    firstpos, lastpos, followpos. Позиции нумеруются с 1 в порядке
+    вхождения символов (классов символов) в выражение, позиция 0
+    соответствует началу. Переход в позицию идет по любому символу
+    перехода из position_symbols, обозначающему класс эквивалентности.
+    """
+
+    def __init__(self, regex_postfix):
+        self.symbols = [None]  # множество символов каждой позиции
+        self.follow = [set()]  # followpos каждой позиции, для 0 - firstpos
+        self.nullable = False
+        self.first = frozenset()
+        self.last = frozenset()
+        self.symbol_classes = dict()  # символ перехода -> интервалы
+        self.position_symbols = [()]  # символы переходов в каждую позицию
+
+        self._build(regex_postfix)
+        self._build_symbol_classes()
+
+    def _build(self, regex_postfix):
+        stack = []  # элементы (nullable, firstpos, lastpos)
+
+        for char in regex_postfix:
+            if char in [RegexConfig.ZERO_OR_MORE, RegexConfig.ONE_OR_MORE]:
+                if len(stack) < 1:
+                    raise ValueError('Regex parsing error')
+
+                nullable, first, last = stack.pop()
+                for position in last:
+                    self.follow[position] |= first
+
+                if char == RegexConfig.ZERO_OR_MORE:
+                    nullable = True
+                stack.append((nullable, first, last))
+
+            elif char == RegexConfig.AND:
+                if len(stack) < 2:
+                    raise ValueError('Regex parsing error')
+
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                for position in last1:
+                    self.follow[position] |= first2
+
+                first = first1 | first2 if nullable1 else first1
+                last = last1 | last2 if nullable2 else last2
+                stack.append((nullable1 and nullable2, first, last))
+
+            elif char == RegexConfig.OR:
+                if len(stack) < 2:
+                    raise ValueError('Regex parsing error')
+
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                stack.append((nullable1 or nullable2, first1 | first2, last1 | last2))
+
+            else:
+                # [A-Za-z0-9] или класс символов
+                chars = get_symbol_chars(char)
+                if chars is None:
+                    raise ValueError('Regex parsing error')
+
+                position = len(self.symbols)
+                self.symbols.append(chars)
+                self.follow.append(set())
+                stack.append((False, frozenset([position]), frozenset([position])))
+
+        if len(stack) != 1:
+            raise ValueError('Regex parsing error')
+
+        self.nullable, self.first, self.last = stack.pop()
+        self.follow[0] = set(self.first)
+
+    def _build_symbol_classes(self):
+        self.symbol_classes = build_symbol_classes(self.symbols[1:])
+        symbol_map = {char: symbol for symbol, intervals in self.symbol_classes.items()
+                      for char in get_interval_chars(intervals)}
+
+        for chars in self.symbols[1:]:
+            self.position_symbols.append(tuple(sorted({symbol_map[char] for char in chars})))
+
+    def is_final(self, position):
+        if position == 0:
+            return self.nullable
+        return position in self.last
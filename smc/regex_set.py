@@ -0,0 +1,89 @@
+from config import BaseConfig
+from smc.dfa import DfaNfa
+from smc.nfa import NfaRegex
+from smc.smc import StateMachine
+from utils import build_symbol_classes, check_regex_symbols, get_interval_chars
+
+
+class RegexSet:
+    """
+    Проверка цепочки сразу по нескольким выражениям. НКА выражений
+    объединяются ε-переходами из общего начального состояния, принимающие
+    состояния помечаются номерами выражений. Метки переносятся в ДКА при
+    построении, поэтому за один проход по цепочке находятся все
+    выражения, которым она соответствует.
+    """
+
+    def __init__(self, patterns):
+        patterns = list(patterns)
+        if len(patterns) == 0:
+            raise ValueError('Patterns list is empty')
+
+        for pattern in patterns:
+            if not isinstance(pattern, str):
+                raise TypeError('Pattern must be str')
+            if not check_regex_symbols(pattern):
+                raise ValueError('Unacceptable symbols in regex')
+
+        self.patterns = patterns
+        self.nfa = None
+        self.dfa = None
+        self.matcher = None
+
+    def _build_nfa(self, nfas):
+        # Общие классы символов для всех выражений: классы отдельных
+        # автоматов разбиваются так, чтобы классы не пересекались
+        char_sets = [nfa.get_symbol_chars(symbol) for nfa in nfas for symbol in nfa.language]
+        symbol_classes = build_symbol_classes(char_sets)
+        symbol_map = {char: symbol for symbol, intervals in symbol_classes.items()
+                      for char in get_interval_chars(intervals)}
+
+        sm = StateMachine()
+        sm.add_init_state(0)
+
+        from_number = 0
+        for label, nfa in enumerate(nfas):
+            nfa.renumber_states(from_number)
+            from_number = max(nfa.states)
+
+            sm.add_transition(sm.init_state, nfa.init_state, BaseConfig.EPSILON)
+            for start_state, end_state, symbol in nfa.transitions:
+                if symbol == BaseConfig.EPSILON:
+                    sm.add_transition(start_state, end_state, symbol)
+                    continue
+
+                for new_symbol in sorted({symbol_map[char] for char in nfa.get_symbol_chars(symbol)}):
+                    sm.add_transition(start_state, end_state, new_symbol)
+
+            for state in nfa.finish_states:
+                sm.add_finish_state(state, label)
+
+        for symbol, intervals in symbol_classes.items():
+            sm.add_symbol_class(symbol, intervals)
+
+        return sm
+
+    def build(self):
+        nfas = []
+        for pattern in self.patterns:
+            nfa = NfaRegex(pattern)
+            nfa.build()
+            nfas.append(nfa.nfa)
+
+        self.nfa = self._build_nfa(nfas)
+        self.dfa = DfaNfa(self.nfa)
+        self.dfa.build()
+        self.dfa.minimize()
+        self.matcher = self.dfa.compile()
+
+    def match(self, chain):
+        """Получить отсортированный список номеров выражений,
+        которым соответствует цепочка"""
+        if self.matcher is None:
+            raise TypeError('Use build() first')
+
+        return sorted(self.matcher.match_labels(chain))
+
+    def match_patterns(self, chain):
+        """Получить список выражений, которым соответствует цепочка"""
+        return [self.patterns[label] for label in self.match(chain)]
@@ -0,0 +1,128 @@
+from array import array
+
+from smc.dfa import DfaNfa
+from smc.smc import StateMachine
+
+
+class Searcher:
+    """
+    Поиск вхождений регулярного выражения в тексте (самое левое,
+    затем самое длинное). Текст один раз читается справа налево: для
+    каждой позиции i находится множество живых состояний ДКА, из
+    которых по некоторому префиксу text[i:] достижимо принимающее
+    состояние. Вхождение начинается там, где живо начальное состояние,
+    конец вхождения находится прямым проходом ДКА от начала, который
+    останавливается, как только текущее состояние перестает быть живым.
+    Поэтому проход не идет дальше конца вхождения, и поиск всех
+    вхождений линеен по длине текста.
+    """
+
+    def __init__(self, nfa):
+        if not nfa or not isinstance(nfa, StateMachine):
+            raise TypeError('Nfa must be non empty StateMachine class member')
+
+        dfa = DfaNfa(nfa)
+        dfa.build()
+        dfa.minimize()
+        self.forward = dfa.compile()
+
+        matcher = self.forward
+        # Переходы в обратную сторону: столбец -> состояние -> предшествующие состояния
+        self._predecessors = [dict() for _ in range(matcher.width)]
+        for state in range(0, len(matcher.table), matcher.width):
+            for column in range(matcher.width):
+                self._predecessors[column].setdefault(matcher.table[state + column], []).append(state)
+
+        # Множества живых состояний нумеруются по мере появления, переходы
+        # между ними запоминаются и переиспользуются между вызовами
+        accepting = frozenset(state for state in range(0, len(matcher.table), matcher.width)
+                              if matcher.is_accepting(state))
+        self._accepting = accepting
+        self._live_sets = []
+        self._live_ids = dict()
+        self._live_moves = []
+        self._live_starts = bytearray()
+        self._add_live_set(accepting)
+
+    def _add_live_set(self, live_set):
+        live_id = len(self._live_sets)
+        self._live_sets.append(live_set)
+        self._live_ids[live_set] = live_id
+        self._live_moves.append([None] * self.forward.width)
+        self._live_starts.append(self.forward.init_state in live_set)
+        return live_id
+
+    def _get_live_move(self, live_id, column):
+        """Множество живых состояний перед символом столбца column"""
+        live_set = set(self._accepting)
+        predecessors = self._predecessors[column]
+        for state in self._live_sets[live_id]:
+            live_set.update(predecessors.get(state, ()))
+
+        live_set = frozenset(live_set)
+        next_id = self._live_ids.get(live_set)
+        if next_id is None:
+            next_id = self._add_live_set(live_set)
+
+        self._live_moves[live_id][column] = next_id
+        return next_id
+
+    def _find_live(self, text):
+        """Номера множеств живых состояний для позиций текста от 0 до len(text)"""
+        columns = self.forward.columns
+        unknown_column = self.forward.unknown_column
+        live_moves = self._live_moves
+
+        live = array('i', [0]) * (len(text) + 1)
+        live_id = 0
+        for i in range(len(text) - 1, -1, -1):
+            column = columns.get(text[i], unknown_column)
+            next_id = live_moves[live_id][column]
+            if next_id is None:
+                next_id = self._get_live_move(live_id, column)
+            live_id = live[i] = next_id
+
+        return live
+
+    def _find_end(self, text, start, live):
+        """Конец самого длинного вхождения, начинающегося в позиции start"""
+        matcher = self.forward
+        table = matcher.table
+        columns = matcher.columns
+        unknown_column = matcher.unknown_column
+        live_sets = self._live_sets
+
+        state = matcher.init_state
+        end = start if matcher.is_accepting(state) else None
+
+        for i in range(start, len(text)):
+            state = table[state + columns.get(text[i], unknown_column)]
+            # Из этого состояния принимающее уже не достигается
+            if state not in live_sets[live[i + 1]]:
+                break
+            if matcher.is_accepting(state):
+                end = i + 1
+
+        return end
+
+    def finditer(self, text):
+        """Получить границы (start, end) непересекающихся вхождений"""
+        live = self._find_live(text)
+        live_starts = self._live_starts
+        # Позиции текста, с которых начинается хотя бы одно вхождение
+        starts = bytes(live_starts[live_id] for live_id in live)
+
+        position = 0
+        while position <= len(text):
+            start = starts.find(1, position)
+            if start == -1:
+                return
+
+            end = self._find_end(text, start, live)
+            yield start, end
+
+            position = end if end > start else start + 1
+
+    def search(self, text):
+        """Получить границы первого вхождения или None"""
+        return next(self.finditer(text), None)
@@ -3,7 +3,8 @@ import uuid
 from itertools import groupby
 from graphviz import Digraph
 
-from config import BaseConfig
+from config import BaseConfig, RegexConfig
+from utils import get_interval_chars
 
 
 class StateMachine:
@@ -12,9 +13,44 @@ class StateMachine:
         self.states = []
         self.init_state = None
         self.finish_states = []
+        self.finish_labels = dict()  # принимающее состояние -> множество меток
         self.catch_state = None
         self.language = []
 
+        # Классы символов: символ перехода -> интервалы символов цепочки,
+        # которые он обозначает. Символ не из словаря обозначает сам себя
+        self.symbol_classes = dict()
+
+        # Индексы переходов: состояние -> символ -> множество состояний
+        self._forward = dict()
+        self._reverse = dict()
+        self._states_set = set()
+        self._transitions_set = set()
+        self._e_closure_table = None
+
+    def _add_state(self, state):
+        if state not in self._states_set:
+            self._states_set.add(state)
+            self.states.append(state)
+            self._e_closure_table = None
+
+    def _index_transition(self, start_state, end_state, symbol):
+        if symbol == BaseConfig.EPSILON:
+            self._e_closure_table = None
+        self._forward.setdefault(start_state, dict()).setdefault(symbol, set()).add(end_state)
+        self._reverse.setdefault(end_state, dict()).setdefault(symbol, set()).add(start_state)
+        self._transitions_set.add((start_state, end_state, symbol))
+
+    def _rebuild_index(self):
+        """Перестроение индексов после изменения нумерации состояний"""
+        self._forward = dict()
+        self._reverse = dict()
+        self._states_set = set(self.states)
+        self._transitions_set = set()
+        self._e_closure_table = None
+        for transition in self.transitions:
+            self._index_transition(transition[0], transition[1], transition[2])
+
     def add_init_state(self, state):
         if self.init_state is not None:
             raise ValueError('Init state is not none')
@@ -23,8 +59,7 @@ class StateMachine:
             raise TypeError('Init state must be int')
 
         self.init_state = state
-        if state not in self.states:
-            self.states.append(state)
+        self._add_state(state)
 
     def add_transition(self, start_state, end_state, symbol):
         if not isinstance(start_state, int):
@@ -36,28 +71,35 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        if start_state not in self.states:
-            self.states.append(start_state)
+        self._add_state(start_state)
+        self._add_state(end_state)
 
-        if end_state not in self.states:
-            self.states.append(end_state)
-
-        transition = [start_state, end_state, symbol]
-        if transition not in self.transitions:
-            self.transitions.append(transition)
+        if (start_state, end_state, symbol) not in self._transitions_set:
+            self.transitions.append([start_state, end_state, symbol])
+            self._index_transition(start_state, end_state, symbol)
 
         if symbol != BaseConfig.EPSILON and symbol not in self.language:
             self.language.append(symbol)
 
-    def add_finish_state(self, state):
+    def add_finish_state(self, state, label=None):
+        """Добавление принимающего состояния. Метка label (например, номер
+        выражения) сохраняется в множестве меток состояния"""
         if not isinstance(state, int):
             raise TypeError('Finish state must be int')
 
         if state not in self.finish_states:
             self.finish_states.append(state)
+            self._add_state(state)
+
+        if label is not None:
+            self.finish_labels.setdefault(state, set()).add(label)
 
-            if state not in self.states:
-                self.states.append(state)
+    def get_finish_labels(self, states):
+        """Получить множество меток принимающих состояний из states"""
+        labels = set()
+        for state in states:
+            labels.update(self.finish_labels.get(state, ()))
+        return frozenset(labels)
 
     def add_catch_state(self, state):
         if self.catch_state is not None:
@@ -67,9 +109,30 @@ class StateMachine:
             raise TypeError('Catch state must be int')
 
         self.catch_state = state
+        self._add_state(state)
 
-        if state not in self.states:
-            self.states.append(state)
+    def add_symbol_class(self, symbol, intervals):
+        """Задать интервалы символов цепочки, обозначаемых символом перехода"""
+        if not isinstance(symbol, str):
+            raise TypeError('Symbol must be str')
+
+        if not isinstance(intervals, tuple):
+            raise TypeError('Intervals must be tuple')
+
+        # Класс из одного символа, обозначающего сам себя, не хранится
+        if get_interval_chars(intervals) != symbol:
+            self.symbol_classes[symbol] = intervals
+
+    def get_symbol_chars(self, symbol):
+        """Получить строку символов цепочки, обозначаемых символом перехода"""
+        intervals = self.symbol_classes.get(symbol)
+        if intervals is None:
+            return symbol
+        return get_interval_chars(intervals)
+
+    def get_symbol_map(self):
+        """Получить словарь: символ цепочки -> символ перехода"""
+        return {char: symbol for symbol in self.language for char in self.get_symbol_chars(symbol)}
 
     def _check_smc(self):
         if len(self.states) == 0:
@@ -108,9 +171,14 @@ class StateMachine:
 
         self.init_state += (1 + from_number)
 
+        self.finish_labels = {state + 1 + from_number: labels
+                              for state, labels in self.finish_labels.items()}
+
         if self.catch_state is not None:
             self.catch_state += (1 + from_number)
 
+        self._rebuild_index()
+
     def get_transitions_start_symbol(self, start_state, symbol):
         """Получить список переходов из состояния start_state
         по символу symbol"""
@@ -121,12 +189,8 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        out_transitions = []
-        for transition in self.transitions:
-            if transition[0] == start_state and transition[2] == symbol:
-                out_transitions.append(transition)
-
-        return sorted(out_transitions)
+        end_states = self._forward.get(start_state, {}).get(symbol, ())
+        return [[start_state, end_state, symbol] for end_state in sorted(end_states)]
 
     def get_transitions_end_symbol(self, end_state, symbol):
         """Получить список переходов в состояние end_state
@@ -138,12 +202,80 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        out_transitions = []
-        for transition in self.transitions:
-            if transition[1] == end_state and transition[2] == symbol:
-                out_transitions.append(transition)
+        start_states = self._reverse.get(end_state, {}).get(symbol, ())
+        return [[start_state, end_state, symbol] for start_state in sorted(start_states)]
 
-        return sorted(out_transitions)
+    def _build_e_closure_table(self):
+        """
+        Вычисление ε-замыканий всех состояний за один проход. Граф
+        ε-переходов разбивается на компоненты сильной связности
+        (алгоритм Тарьяна), компоненты получаются в порядке, обратном
+        топологическому, поэтому замыкания последующих компонент уже
+        известны к моменту обработки текущей.
+        """
+        table = dict()
+        index = dict()
+        lowlink = dict()
+        stack = []
+        on_stack = set()
+
+        def e_successors(state):
+            return self._forward.get(state, {}).get(BaseConfig.EPSILON, ())
+
+        for root in self.states:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(e_successors(root)))]
+
+            while work:
+                state, successors = work[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(e_successors(successor))))
+                        break
+                    if successor in on_stack:
+                        lowlink[state] = min(lowlink[state], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[state])
+
+                    if lowlink[state] == index[state]:
+                        component = []
+                        while True:
+                            curr_state = stack.pop()
+                            on_stack.discard(curr_state)
+                            component.append(curr_state)
+                            if curr_state == state:
+                                break
+
+                        closure = set(component)
+                        for curr_state in component:
+                            for successor in e_successors(curr_state):
+                                if successor in table:
+                                    closure |= table[successor]
+
+                        closure = frozenset(closure)
+                        for curr_state in component:
+                            table[curr_state] = closure
+
+        return table
+
+    def get_e_closure_table(self):
+        """Получить словарь ε-замыканий всех состояний (состояние -> frozenset).
+        Словарь вычисляется один раз и сбрасывается при изменении автомата"""
+        if self._e_closure_table is None:
+            self._e_closure_table = self._build_e_closure_table()
+
+        return self._e_closure_table
 
     def get_e_closure(self, state):
         """Получить список состояний, достижимых из состояния state
@@ -157,18 +289,9 @@ class StateMachine:
         if not isinstance(state, int):
             raise TypeError('State must be int')
 
-        e_closure = []
-        stack = [state]
-        while len(stack) > 0:
-            curr_state = stack.pop()
-            if curr_state not in e_closure:
-                e_closure.append(curr_state)
-            suitable_transitions = self.get_transitions_start_symbol(curr_state, BaseConfig.EPSILON)
-            for transition in suitable_transitions:
-                stack.insert(0, transition[1])
-
-        if len(e_closure) == 0:
-            return None
+        e_closure = self.get_e_closure_table().get(state)
+        if e_closure is None:
+            return [state]
 
         return sorted(e_closure)
 
@@ -184,12 +307,10 @@ class StateMachine:
         if not isinstance(state_list, list):
             raise TypeError('State list must be list')
 
-        e_closure_list = []
+        table = self.get_e_closure_table()
+        e_closure_list = set()
         for state in state_list:
-            curr_list = self.get_e_closure(state)
-            for curr_state in curr_list:
-                if curr_state not in e_closure_list:
-                    e_closure_list.append(curr_state)
+            e_closure_list.update(table.get(state, (state,)))
 
         if len(e_closure_list) == 0:
             return None
@@ -208,16 +329,11 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        move = []
-        transitions = self.get_transitions_start_symbol(start_state, symbol)
+        move = self._forward.get(start_state, {}).get(symbol)
 
-        if len(transitions) == 0:
+        if not move:
             return None
 
-        for transition in transitions:
-            if transition[1] not in move:
-                move.append(transition[1])
-
         return sorted(move)
 
     def get_move_list(self, start_states_list, symbol):
@@ -235,13 +351,9 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        move_list = []
+        move_list = set()
         for state in start_states_list:
-            curr_list = self.get_move(state, symbol)
-            if curr_list is not None:
-                for curr_state in curr_list:
-                    if curr_state not in move_list:
-                        move_list.append(curr_state)
+            move_list.update(self._forward.get(state, {}).get(symbol, ()))
 
         if len(move_list) == 0:
             return None
@@ -257,16 +369,11 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        out_states = []
-        transitions = self.get_transitions_end_symbol(end_state, symbol)
+        out_states = self._reverse.get(end_state, {}).get(symbol)
 
-        if len(transitions) == 0:
+        if not out_states:
             return None
 
-        for transition in transitions:
-            if transition[0] not in out_states:
-                out_states.append(transition[0])
-
         return sorted(out_states)
 
     def get_come_list(self, end_states_list, symbol):
@@ -281,13 +388,9 @@ class StateMachine:
         if not isinstance(symbol, str):
             raise TypeError('Symbol must be str')
 
-        out_states = []
+        out_states = set()
         for state in end_states_list:
-            curr_list = self.get_come(state, symbol)
-            if curr_list is not None:
-                for curr_state in curr_list:
-                    if curr_state not in out_states:
-                        out_states.append(curr_state)
+            out_states.update(self._reverse.get(state, {}).get(symbol, ()))
 
         if len(out_states) == 0:
             return None
@@ -314,36 +417,37 @@ class StateMachine:
         # Изменение нумерации
         old_indices = list(set(self.states) - (set(states)))
         old_indices.append(combined_index)
-        old_indices = sorted(old_indices)
-        new_indices = [x for x in range(len(old_indices))]
-
-        for transition in self.transitions:
-            index = old_indices.index(transition[0])
-            transition[0] = new_indices[index]
+        new_indices = {old: new for new, old in enumerate(sorted(old_indices))}
 
         for transition in self.transitions:
-            index = old_indices.index(transition[1])
-            transition[1] = new_indices[index]
+            transition[0] = new_indices[transition[0]]
+            transition[1] = new_indices[transition[1]]
 
         for i, state in enumerate(self.states):
             if state in states:
-                self.states[i] = combined_index
+                self.states[i] = new_indices[combined_index]
             else:
-                index = old_indices.index(state)
-                self.states[i] = new_indices[index]
+                self.states[i] = new_indices[state]
 
         for i, state in enumerate(self.finish_states):
             if state in states:
-                self.finish_states[i] = combined_index
+                self.finish_states[i] = new_indices[combined_index]
             else:
-                index = old_indices.index(state)
-                self.finish_states[i] = new_indices[index]
+                self.finish_states[i] = new_indices[state]
+
+        finish_labels = dict()
+        for state, labels in self.finish_labels.items():
+            new_state = new_indices[combined_index if state in states else state]
+            finish_labels.setdefault(new_state, set()).update(labels)
+        self.finish_labels = finish_labels
 
         # Удаление дубликатов
         self.transitions = [tran[0] for tran in groupby(sorted(self.transitions))]
         self.states = [state[0] for state in groupby(sorted(self.states))]
         self.finish_states = [state[0] for state in groupby(sorted(self.finish_states))]
 
+        self._rebuild_index()
+
     def draw(self):
         try:
             filename = str(uuid.uuid4()) + '.gv'
@@ -357,17 +461,31 @@ class StateMachine:
             f.attr('node', shape='circle')
 
             for transition in self.transitions:
-                f.edge(str(transition[0]), str(transition[1]), str(transition[2]))
+                f.edge(str(transition[0]), str(transition[1]), self._get_symbol_label(transition[2]))
 
             f.render()
         except:
             print('Graph creation error')
 
+    def _get_symbol_label(self, symbol):
+        intervals = self.symbol_classes.get(symbol)
+        if intervals is None:
+            return str(symbol)
+
+        label = ''
+        for first, last in intervals:
+            label += first if first == last else first + RegexConfig.CLASS_RANGE + last
+        return RegexConfig.CLASS_OPEN + label + RegexConfig.CLASS_CLOSE
+
     def debug_print_info(self):
         print('transitions: ', self.transitions)
         print('states: ', self.states)
         print('init state: ', self.init_state)
         print('catch state: ', self.catch_state)
         print('finish states: ', self.finish_states)
+        if self.finish_labels:
+            print('finish labels: ', self.finish_labels)
         print('language: ', self.language)
+        if self.symbol_classes:
+            print('symbol classes: ', self.symbol_classes)
         print()
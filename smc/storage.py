@@ -0,0 +1,157 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from config import MatcherConfig
+from smc.cache import compile_regex
+from smc.matcher import DfaMatcher
+
+# Формат файла:
+#   заголовок HEADER (magic, версия формата, размер элемента таблицы,
+#   порядок байт, число состояний, ширина строки, начальное состояние,
+#   длина алфавита в байтах);
+#   алфавит в UTF-8 (символы каждого столбца, столбцы разделены '\n'),
+#   дополненный нулями до границы 4 байт;
+#   таблица переходов (int32, смещения строк, как в DfaMatcher);
+#   битовая карта принимающих состояний;
+#   метки состояний (uint32): для каждого состояния число меток и сами метки.
+MAGIC = b'SMCD'
+FORMAT_VERSION = 3
+ALPHABET_SEPARATOR = '\n'
+HEADER = struct.Struct('<4sHBBIIII')
+ITEM_SIZE = 4
+BYTE_ORDERS = {'little': 0, 'big': 1}
+
+
+def _align(size):
+    return (size + ITEM_SIZE - 1) // ITEM_SIZE * ITEM_SIZE
+
+
+def dump_matcher(matcher):
+    """Сериализация скомпилированного ДКА в байты"""
+    if not isinstance(matcher, DfaMatcher):
+        raise TypeError('Matcher must be DfaMatcher class member')
+
+    if matcher.table.itemsize != ITEM_SIZE:
+        raise ValueError('Unsupported table item size')
+
+    alphabet = ALPHABET_SEPARATOR.join(matcher.alphabet).encode('utf-8')
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, ITEM_SIZE, BYTE_ORDERS[sys.byteorder],
+                         matcher.states_count, matcher.width, matcher.init_state, len(alphabet))
+
+    bitmap = bytearray((matcher.states_count + 7) // 8)
+    for state, is_accepting in enumerate(matcher.accepting):
+        if is_accepting:
+            bitmap[state // 8] |= 1 << (state % 8)
+
+    labels = []
+    for state_labels in matcher.labels:
+        labels.append(len(state_labels))
+        labels.extend(sorted(state_labels))
+    labels = struct.pack('<{}I'.format(len(labels)), *labels)
+
+    alphabet += bytes(_align(len(alphabet)) - len(alphabet))
+    return b''.join([header, alphabet, matcher.table.tobytes(), bytes(bitmap), labels])
+
+
+def loads_matcher(buffer):
+    """Создание ДКА поверх буфера без копирования таблицы переходов"""
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError('Broken matcher data')
+
+    (magic, version, item_size, byte_order, states_count,
+     width, init_state, alphabet_size) = HEADER.unpack_from(view)
+
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError('Unknown matcher data format')
+
+    if item_size != ITEM_SIZE or byte_order != BYTE_ORDERS[sys.byteorder]:
+        raise ValueError('Matcher data was written on incompatible platform')
+
+    alphabet_offset = HEADER.size
+    table_offset = alphabet_offset + _align(alphabet_size)
+    bitmap_offset = table_offset + states_count * width * ITEM_SIZE
+    labels_offset = bitmap_offset + (states_count + 7) // 8
+    if len(view) < labels_offset + states_count * 4 or (len(view) - labels_offset) % 4 != 0:
+        raise ValueError('Broken matcher data')
+
+    alphabet = bytes(view[alphabet_offset:alphabet_offset + alphabet_size]).decode('utf-8')
+    alphabet = alphabet.split(ALPHABET_SEPARATOR) if alphabet else []
+    table = view[table_offset:bitmap_offset].cast('i').toreadonly()
+    bitmap = view[bitmap_offset:labels_offset]
+    accepting = bytes((bitmap[state // 8] >> (state % 8)) & 1 for state in range(states_count))
+
+    items = struct.unpack_from('<{}I'.format((len(view) - labels_offset) // 4), view, labels_offset)
+    labels = []
+    position = 0
+    for _ in range(states_count):
+        if position >= len(items) or position + 1 + items[position] > len(items):
+            raise ValueError('Broken matcher data')
+        labels.append(items[position + 1:position + 1 + items[position]])
+        position += 1 + items[position]
+    if position != len(items):
+        raise ValueError('Broken matcher data')
+
+    return DfaMatcher.from_table(alphabet, table, init_state, accepting, labels)
+
+
+def write_file(path, data):
+    """Атомарная запись байтов в файл: данные пишутся во временный
+    файл в том же каталоге, который затем переименовывается"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_matcher(matcher, path):
+    """Атомарная запись ДКА в файл"""
+    write_file(path, dump_matcher(matcher))
+
+
+def load_matcher(path):
+    """Загрузка ДКА из файла через mmap. Таблица переходов не копируется,
+    поэтому процессы, загрузившие один файл, разделяют страницы памяти"""
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads_matcher(data)
+
+
+class DiskCache:
+    """
+    Кэш скомпилированных выражений в каталоге на диске. Имя файла -
+    хэш выражения и версии движка, поэтому после изменения движка
+    старые файлы не используются.
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = MatcherConfig.disk_cache_dir
+
+        self.directory = directory
+
+    def get_path(self, regex):
+        key = '{}:{}'.format(MatcherConfig.ENGINE_VERSION, regex).encode('utf-8')
+        return os.path.join(self.directory, hashlib.sha256(key).hexdigest() + '.dfa')
+
+    def get(self, regex):
+        path = self.get_path(regex)
+        try:
+            return load_matcher(path)
+        except (OSError, ValueError):
+            pass
+
+        matcher = compile_regex(regex)
+        save_matcher(matcher, path)
+        return matcher
@@ -0,0 +1,35 @@
+import unittest
+from smc.batch import BatchMatcher
+from tests.matcher_test import generate_matcher
+
+
+class TestBatchMatcher(unittest.TestCase):
+    def test_not_matcher(self):
+        with self.assertRaises(TypeError):
+            BatchMatcher([])
+
+    def test_encode(self):
+        batch = BatchMatcher(generate_matcher('(a|b)*abb'))
+        matrix, lengths = batch.encode(['ab', 'bca', ''])
+        self.assertEqual(lengths.tolist(), [2, 3, 0])
+        self.assertEqual(matrix.tolist(), [[0, 1, 3], [1, 2, 0], [3, 3, 3]])
+
+    def test_match_std(self):
+        batch = BatchMatcher(generate_matcher('(a|b)*abb'))
+        result = batch.match(['ababaabb', 'ababaab', '', 'abb', 'abcabb', 'bbbbbbbbbbabb'])
+        self.assertEqual(result.tolist(), [True, False, False, True, False, True])
+
+    def test_match_empty(self):
+        batch = BatchMatcher(generate_matcher('a?'))
+        self.assertEqual(batch.match([]).tolist(), [])
+        self.assertEqual(batch.match(['', 'aaa', 'ab']).tolist(), [False, True, False])
+
+    def test_match_same_as_matcher(self):
+        matcher = generate_matcher('a?b?(abc)*')
+        chains = ['abbabc', 'abbab', 'b', 'aabc', 'ab', 'abcabc', 'aabbbabcabc']
+        result = BatchMatcher(matcher).match(chains)
+        self.assertEqual(result.tolist(), [matcher.match(chain) for chain in chains])
+
+
+if __name__ == "__main__":
+    unittest.main()
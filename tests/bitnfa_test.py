@@ -0,0 +1,61 @@
+import unittest
+from smc.bitnfa import BitNfa
+from smc.nfa import NfaRegex
+from tests.smc_test import generate_simple_smc
+
+
+def generate_bit_nfa(regex):
+    nfa = NfaRegex(regex)
+    nfa.build()
+    return BitNfa(nfa.nfa)
+
+
+class TestBitNfa(unittest.TestCase):
+    def test_not_smc(self):
+        with self.assertRaises(TypeError):
+            BitNfa([])
+
+    def test_masks_simple(self):
+        bit_nfa = BitNfa(generate_simple_smc())
+        self.assertEqual(bit_nfa.start_mask, 0b01)
+        self.assertEqual(bit_nfa.finish_mask, 0b10)
+        self.assertEqual(bit_nfa.successors, {'a': {0: 0b10}})
+        self.assertEqual(bit_nfa.step(0b01, 'a'), 0b10)
+        self.assertEqual(bit_nfa.step(0b10, 'a'), 0)
+        self.assertEqual(bit_nfa.step(0b01, 'b'), 0)
+
+    def test_matches_std(self):
+        bit_nfa = generate_bit_nfa('(a|b)*abb')
+        self.assertTrue(bit_nfa.matches('ababaabb'))
+        self.assertFalse(bit_nfa.matches('ababaab'))
+        self.assertFalse(bit_nfa.matches('abcabb'))
+        self.assertFalse(bit_nfa.matches(''))
+
+    def test_matches_nullable(self):
+        bit_nfa = generate_bit_nfa('a?b?(abc)*')
+        self.assertTrue(bit_nfa.matches('abbabc'))
+        self.assertFalse(bit_nfa.matches('abbab'))
+        self.assertTrue(generate_bit_nfa('(ab)*').matches(''))
+
+    def test_matches_char_class(self):
+        bit_nfa = generate_bit_nfa('[a-c]*d')
+        self.assertEqual(sorted(bit_nfa.successors), ['a', 'd'])
+        self.assertTrue(bit_nfa.matches('cbad'))
+        self.assertFalse(bit_nfa.matches('cbed'))
+
+    def test_step_char_class(self):
+        bit_nfa = generate_bit_nfa('(a|b)c')
+        mask = bit_nfa.step(bit_nfa.start_mask, 'b')
+        self.assertNotEqual(mask, 0)
+        self.assertEqual(mask, bit_nfa.step(bit_nfa.start_mask, 'a'))
+        self.assertNotEqual(bit_nfa.step(mask, 'c') & bit_nfa.finish_mask, 0)
+        self.assertEqual(bit_nfa.step(bit_nfa.start_mask, 'c'), 0)
+
+    def test_matches_blowup(self):
+        bit_nfa = generate_bit_nfa('(a|b)*a(a|b)(a|b)(a|b)(a|b)(a|b)(a|b)(a|b)(a|b)')
+        self.assertTrue(bit_nfa.matches('bbbbabbbbbbbb'))
+        self.assertFalse(bit_nfa.matches('abbbbbbbbbbbb'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from smc.cache import PatternCache, compile, pattern_cache
+
+
+class TestPatternCache(unittest.TestCase):
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            PatternCache(0)
+
+    def test_get_hit(self):
+        cache = PatternCache(2)
+        matcher = cache.get('(a|b)*abb')
+        self.assertIs(cache.get('(a|b)*abb'), matcher)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+        self.assertTrue(matcher.match('abb'))
+
+    def test_eviction(self):
+        cache = PatternCache(2)
+        cache.get('a')
+        cache.get('b')
+        cache.get('a')
+        cache.get('c')
+        self.assertEqual(list(cache.cache), ['a', 'c'])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_resize(self):
+        cache = PatternCache(3)
+        cache.get('a')
+        cache.get('b')
+        cache.get('c')
+        cache.resize(1)
+        self.assertEqual(list(cache.cache), ['c'])
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 3, 'evictions': 2,
+                                             'size': 1, 'maxsize': 1})
+
+    def test_error_not_cached(self):
+        cache = PatternCache(2)
+        with self.assertRaises(ValueError):
+            cache.get('(a|b')
+        self.assertEqual(len(cache.cache), 0)
+
+    def test_clear(self):
+        cache = PatternCache(2)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(cache.get_stats()['size'], 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_compile(self):
+        matcher = compile('a?b')
+        self.assertIs(compile('a?b'), matcher)
+        self.assertIn('a?b', pattern_cache.cache)
+        self.assertTrue(matcher.match('aab'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import shutil
+import tempfile
+import unittest
+from smc.cache import build_dfa, compile_regex
+from smc.codegen import CodegenCache, build_function, generate_source
+from tests.smc_test import generate_simple_smc
+
+
+class TestCodegen(unittest.TestCase):
+    def test_not_smc(self):
+        with self.assertRaises(TypeError):
+            generate_source([])
+
+    def test_source_simple(self):
+        source = generate_source(generate_simple_smc())
+        self.assertEqual(source, 'def match(chain):\n'
+                                 '    state = 0\n'
+                                 '    for char in chain:\n'
+                                 '        if state == 0:\n'
+                                 "            if char == 'a':\n"
+                                 '                state = 1\n'
+                                 '            else:\n'
+                                 '                return False\n'
+                                 '        else:\n'
+                                 '            return False\n'
+                                 '    return state == 1\n')
+
+    def test_source_char_class(self):
+        source = generate_source(build_dfa('[a-c]([a-z0-1])*').dfa, 'is_word')
+        self.assertIn("def is_word(chain, _chars0=frozenset('01abcdefghijklmnopqrstuvwxyz')):", source)
+        self.assertIn("if 'a' <= char <= 'c':", source)
+        self.assertIn('if char in _chars0:', source)
+
+    def test_function_same_as_matcher(self):
+        random.seed(2)
+        for regex in ['(a|b)*abb', 'a?b?(abc)*', '[^a-c]*c', '(ab)*', '[a-c][0-9]?', '(a|b)*a(a|b)(a|b)(a|b)']:
+            function = build_function(build_dfa(regex).dfa)
+            matcher = compile_regex(regex)
+            for _ in range(50):
+                chain = ''.join(random.choice('abcz9$') for _ in range(random.randint(0, 8)))
+                self.assertEqual(function(chain), matcher.match(chain))
+
+
+class TestCodegenCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_cache(self):
+        cache = CodegenCache(self.directory)
+        function = cache.get('(a|b)*abb')
+        self.assertTrue(function('babb'))
+        self.assertFalse(function('bab'))
+
+        with open(cache.get_path('(a|b)*abb')) as f:
+            self.assertIn('def match(chain):', f.read())
+
+        function = CodegenCache(self.directory).get('(a|b)*abb')
+        self.assertTrue(function('abb'))
+
+    def test_cache_broken_file(self):
+        cache = CodegenCache(self.directory)
+        with open(cache.get_path('a?'), 'w') as f:
+            f.write('def match(')
+        self.assertTrue(cache.get('a?')('aaa'))
+
+
+if __name__ == "__main__":
+    unittest.main()
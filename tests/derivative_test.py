@@ -0,0 +1,85 @@
+import unittest
+from smc.derivative import DerivativeMatcher
+
+
+def generate_derivative_matcher(regex):
+    matcher = DerivativeMatcher(regex)
+    matcher.build()
+    return matcher
+
+
+class TestDerivativeMatcher(unittest.TestCase):
+    def test_unacceptable(self):
+        with self.assertRaises(ValueError):
+            DerivativeMatcher('a$')
+
+    def test_matches_without_build(self):
+        matcher = DerivativeMatcher('a')
+        with self.assertRaises(TypeError):
+            matcher.matches('a')
+
+    def test_parsing_error(self):
+        matcher = DerivativeMatcher('a|')
+        with self.assertRaises(ValueError):
+            matcher.build()
+
+    def test_smart_constructors(self):
+        matcher = DerivativeMatcher('a')
+        a = matcher._symbol('a')
+        b = matcher._symbol('b')
+        self.assertIs(matcher._symbol('a'), a)
+        self.assertIs(matcher._concat(matcher.epsilon, a), a)
+        self.assertIs(matcher._concat(a, matcher.empty), matcher.empty)
+        self.assertIs(matcher._union(a, a), a)
+        self.assertIs(matcher._union(a, b), matcher._union(b, a))
+        self.assertIs(matcher._union(matcher._union(a, b), a), matcher._union(a, b))
+        self.assertIs(matcher._star(matcher._star(a)), matcher._star(a))
+        self.assertIs(matcher._concat(matcher._concat(a, b), a), matcher._concat(a, matcher._concat(b, a)))
+
+    def test_derivative(self):
+        matcher = generate_derivative_matcher('ab')
+        self.assertIs(matcher.derivative(matcher.start, 'a'), matcher._symbol('b'))
+        self.assertIs(matcher.derivative(matcher.start, 'b'), matcher.empty)
+
+    def test_matches_std(self):
+        matcher = generate_derivative_matcher('(a|b)*abb')
+        self.assertTrue(matcher.matches('ababaabb'))
+        self.assertFalse(matcher.matches('ababaab'))
+        self.assertFalse(matcher.matches('abcabb'))
+        self.assertFalse(matcher.matches(''))
+
+    def test_matches_nullable(self):
+        matcher = generate_derivative_matcher('a?b?(abc)*')
+        self.assertTrue(matcher.matches('abbabc'))
+        self.assertFalse(matcher.matches('abbab'))
+        self.assertTrue(generate_derivative_matcher('(ab)*').matches(''))
+
+    def test_matches_char_class(self):
+        matcher = generate_derivative_matcher('[a-c]*[^a-z]')
+        self.assertTrue(matcher.matches('cabZ'))
+        self.assertFalse(matcher.matches('cabd'))
+        self.assertFalse(matcher.matches('cab$'))
+
+    def test_matches_long(self):
+        matcher = generate_derivative_matcher('ab' * 3000)
+        self.assertTrue(matcher.matches('ab' * 3000))
+        self.assertFalse(matcher.matches('ab' * 2999 + 'a'))
+        self.assertFalse(matcher.matches('ab' * 2999 + 'aa'))
+
+    def test_matches_deep(self):
+        matcher = generate_derivative_matcher('(a|' * 800 + 'b' + ')c' * 800)
+        self.assertTrue(matcher.matches('b' + 'c' * 800))
+        self.assertFalse(matcher.matches('b' + 'c' * 799))
+        self.assertTrue(matcher.matches('acc'))
+        self.assertFalse(matcher.matches('ac'))
+
+    def test_states_reused(self):
+        matcher = generate_derivative_matcher('(a|b)*abb')
+        matcher.matches('ababaabbabab')
+        terms_count = matcher.get_terms_count()
+        matcher.matches('babbababaabb')
+        self.assertEqual(matcher.get_terms_count(), terms_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
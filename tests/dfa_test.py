@@ -1,6 +1,7 @@
 import unittest
 from smc.dfa import DfaNfa
 from smc.nfa import NfaRegex
+from smc.smc import StateMachine
 
 
 class TestDfaNfa(unittest.TestCase):
@@ -9,31 +10,38 @@ class TestDfaNfa(unittest.TestCase):
         nfa.build()
         dfa = DfaNfa(nfa.nfa)
         dfa.build()
-        self.assertEqual(dfa.dfa.states, [0, 1, 2, 4, 5])
+        self.assertEqual(dfa.dfa.states, [0, 1, 2, 3, 4])
         self.assertEqual(dfa.dfa.init_state, 0)
-        self.assertEqual(dfa.dfa.finish_states, [5])
+        self.assertEqual(dfa.dfa.finish_states, [4])
         self.assertEqual(dfa.dfa.language, ['a', 'b'])
         self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a'], [0, 2, 'b'],
+                                               [1, 1, 'a'], [1, 3, 'b'],
                                                [2, 1, 'a'], [2, 2, 'b'],
-                                               [1, 1, 'a'], [1, 4, 'b'],
-                                               [4, 1, 'a'], [4, 5, 'b'],
-                                               [5, 1, 'a'], [5, 2, 'b']])
+                                               [3, 1, 'a'], [3, 4, 'b'],
+                                               [4, 1, 'a'], [4, 2, 'b']])
 
     def test_build_correct(self):
         nfa = NfaRegex('a?b?(abc)*')
         nfa.build()
         dfa = DfaNfa(nfa.nfa)
         dfa.build()
-        self.assertEqual(dfa.dfa.states, [0, 1, 2, 3, 4, 5, 7, 8])
+        self.assertEqual(dfa.dfa.states, [0, 1, 2, 3, 4, 5])
         self.assertEqual(dfa.dfa.init_state, 0)
-        self.assertEqual(dfa.dfa.finish_states, [3, 5, 8])
+        self.assertEqual(dfa.dfa.finish_states, [2, 5])
         self.assertEqual(dfa.dfa.language, ['a', 'b', 'c'])
-        self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a'], [1, 2, 'a'],
-                                               [1, 3, 'b'], [3, 4, 'a'],
-                                               [3, 5, 'b'], [5, 4, 'a'],
-                                               [5, 5, 'b'], [4, 7, 'b'],
-                                               [7, 8, 'c'], [8, 4, 'a'],
-                                               [2, 2, 'a'], [2, 3, 'b']])
+        self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a'], [1, 1, 'a'],
+                                               [1, 2, 'b'], [2, 3, 'a'],
+                                               [2, 2, 'b'], [3, 4, 'b'],
+                                               [4, 5, 'c'], [5, 3, 'a']])
+
+    def test_build_nullable(self):
+        nfa = NfaRegex('(ab)*')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        self.assertEqual(dfa.dfa.states, [0, 1, 2])
+        self.assertEqual(dfa.dfa.finish_states, [0, 2])
+        self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a'], [1, 2, 'b'], [2, 1, 'a']])
 
     def test_minimize_correct_std(self):
         nfa = NfaRegex('(a|b)*abb')
@@ -65,6 +73,32 @@ class TestDfaNfa(unittest.TestCase):
                                                [2, 3, 'a'], [3, 4, 'b'],
                                                [4, 5, 'c'], [5, 3, 'a']])
 
+    def test_minimize_blowup(self):
+        nfa = NfaRegex('(a|b)*a(a|b)(a|b)(a|b)')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(len(dfa.dfa.states), 16)
+        dfa.minimize()
+        self.assertEqual(len(dfa.dfa.states), 16)
+        self.assertEqual(dfa.matches('bbabbb'), True)
+        self.assertEqual(dfa.matches('bbbabb'), False)
+
+    def test_minimize_dead_states(self):
+        smc = StateMachine()
+        smc.add_init_state(0)
+        smc.add_transition(0, 1, 'a')
+        smc.add_transition(0, 2, 'b')
+        smc.add_transition(2, 2, 'b')
+        smc.add_finish_state(1)
+        dfa = DfaNfa(smc)
+        dfa.dfa = smc
+        dfa.minimize()
+        self.assertEqual(dfa.dfa.states, [0, 1])
+        self.assertEqual(dfa.dfa.finish_states, [1])
+        self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a']])
+
     def test_run_valid_std(self):
         nfa = NfaRegex('(a|b)*abb')
         nfa.build()
@@ -83,6 +117,74 @@ class TestDfaNfa(unittest.TestCase):
         result = dfa.run('ababaab')
         self.assertEqual(result, False)
 
+    def test_matches_std(self):
+        nfa = NfaRegex('(a|b)*abb')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(dfa.matches('ababaabb'), True)
+        self.assertEqual(dfa.matches('ababaab'), False)
+
+    def test_matches_without_build(self):
+        nfa = NfaRegex('(a|b)*abb')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        with self.assertRaises(TypeError):
+            dfa.matches('abb')
+
+    def test_matches_after_minimize(self):
+        nfa = NfaRegex('a?b?(abc)*')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        self.assertEqual(dfa.matches('abbabc'), True)
+        dfa.minimize()
+        self.assertEqual(dfa.matches('abbabc'), True)
+        self.assertEqual(dfa.matches('abbab'), False)
+
+    def test_matches_char_class(self):
+        nfa = NfaRegex('[a-zA-Z][a-zA-Z0-9]*')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(sorted(dfa.dfa.language), ['0', 'A'])
+        self.assertEqual(len(dfa.dfa.states), 2)
+        self.assertEqual(dfa.matches('x9Yz'), True)
+        self.assertEqual(dfa.matches('9x'), False)
+        self.assertEqual(dfa.run('Ab1'), True)
+
+    def test_matches_negated_char_class(self):
+        nfa = NfaRegex('[^0-9]?0')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(dfa.matches('abZ0'), True)
+        self.assertEqual(dfa.matches('a10'), False)
+
+    def test_matches_deep(self):
+        # Вложенность выражения больше предела рекурсии интерпретатора
+        nfa = NfaRegex('(a|' * 800 + 'b' + ')c' * 800)
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(dfa.matches('b' + 'c' * 800), True)
+        self.assertEqual(dfa.matches('b' + 'c' * 799), False)
+        self.assertEqual(dfa.matches('acc'), True)
+        self.assertEqual(dfa.matches('ac'), False)
+
+    def test_match_many_std(self):
+        nfa = NfaRegex('(a|b)*abb')
+        nfa.build()
+        dfa = DfaNfa(nfa.nfa)
+        dfa.build()
+        dfa.minimize()
+        result = list(dfa.match_many(['abb', 'ab', '', 'babb']))
+        self.assertEqual(result, [True, False, False, True])
+
 
 if __name__ == "__main__":
     unittest.main()
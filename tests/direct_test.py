@@ -0,0 +1,70 @@
+import unittest
+from smc.dfa import DfaNfa
+from smc.direct import DfaRegex
+from smc.nfa import NfaRegex
+
+
+class TestDfaRegex(unittest.TestCase):
+    def test_unacceptable(self):
+        with self.assertRaises(ValueError):
+            DfaRegex('a$')
+
+    def test_attributes(self):
+        nfa = NfaRegex('ab')
+        nfa.build()
+        self.assertLessEqual(set(vars(DfaNfa(nfa.nfa))), set(vars(DfaRegex('ab'))))
+
+    def test_build_std(self):
+        dfa = DfaRegex('(a|b)*abb')
+        dfa.build()
+        self.assertEqual(dfa.nfa, None)
+        self.assertEqual(dfa.dfa.states, [0, 1, 2, 3, 4])
+        self.assertEqual(dfa.dfa.init_state, 0)
+        self.assertEqual(dfa.dfa.finish_states, [4])
+        self.assertEqual(dfa.dfa.language, ['a', 'b'])
+        self.assertEqual(dfa.dfa.transitions, [[0, 1, 'a'], [0, 2, 'b'],
+                                               [1, 1, 'a'], [1, 3, 'b'],
+                                               [2, 1, 'a'], [2, 2, 'b'],
+                                               [3, 1, 'a'], [3, 4, 'b'],
+                                               [4, 1, 'a'], [4, 2, 'b']])
+
+    def test_build_nullable(self):
+        dfa = DfaRegex('(ab)*')
+        dfa.build()
+        self.assertEqual(dfa.dfa.finish_states, [0, 2])
+
+    def test_minimize_std(self):
+        dfa = DfaRegex('(a|b)*abb')
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(dfa.dfa.states, [0, 1, 2, 3])
+        self.assertEqual(dfa.dfa.finish_states, [3])
+        self.assertEqual(dfa.dfa.transitions, [[0, 0, 'b'], [0, 1, 'a'],
+                                               [1, 1, 'a'], [1, 2, 'b'],
+                                               [2, 1, 'a'], [2, 3, 'b'],
+                                               [3, 0, 'b'], [3, 1, 'a']])
+
+    def test_matches(self):
+        dfa = DfaRegex('a?b?(abc)*')
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(dfa.matches('abbabc'), True)
+        self.assertEqual(dfa.matches('abbab'), False)
+        self.assertEqual(dfa.compile().match('ab'), True)
+
+    def test_matches_char_class(self):
+        dfa = DfaRegex('[^0-9]([a-z0-9])*')
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(len(dfa.dfa.states), 2)
+        self.assertEqual(dfa.matches('Ab0z'), True)
+        self.assertEqual(dfa.matches('AB'), False)
+
+    def test_run(self):
+        dfa = DfaRegex('(a|b)*abb')
+        dfa.build()
+        self.assertEqual(dfa.run('ababb'), True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from smc.dfa import DfaNfa
+from smc.glushkov import GlushkovRegex
+from smc.positions import RegexPositions
+from utils import prepare_regex
+
+
+class TestRegexPositions(unittest.TestCase):
+    def test_positions_std(self):
+        positions = RegexPositions(prepare_regex('(a|b)*abb'))
+        self.assertEqual(positions.symbols, [None] + [frozenset(char) for char in 'ababb'])
+        self.assertEqual(positions.position_symbols, [(), ('a',), ('b',), ('a',), ('b',), ('b',)])
+        self.assertEqual(positions.first, {1, 2, 3})
+        self.assertEqual(positions.last, {5})
+        self.assertEqual(positions.nullable, False)
+        self.assertEqual(positions.follow, [{1, 2, 3}, {1, 2, 3}, {1, 2, 3}, {4}, {5}, set()])
+
+    def test_positions_nullable(self):
+        positions = RegexPositions(prepare_regex('a?b*'))
+        self.assertEqual(positions.nullable, False)
+        self.assertEqual(positions.last, {1, 2})
+        self.assertEqual(positions.follow, [{1}, {1, 2}, {2}])
+        self.assertEqual(RegexPositions(prepare_regex('(ab)*')).nullable, True)
+
+    def test_parsing_error(self):
+        with self.assertRaises(ValueError):
+            RegexPositions(['a', '&'])
+
+
+class TestGlushkovRegex(unittest.TestCase):
+    def test_unacceptable(self):
+        with self.assertRaises(ValueError):
+            GlushkovRegex('a$')
+
+    def test_build_std(self):
+        glushkov = GlushkovRegex('(a|b)*abb')
+        glushkov.build()
+        sm = glushkov.nfa
+        self.assertEqual(sm.states, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(sm.init_state, 0)
+        self.assertEqual(sm.finish_states, [5])
+        self.assertEqual(sm.language, ['a', 'b'])
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [0, 2, 'b'], [0, 3, 'a'],
+                                          [1, 1, 'a'], [1, 2, 'b'], [1, 3, 'a'],
+                                          [2, 1, 'a'], [2, 2, 'b'], [2, 3, 'a'],
+                                          [3, 4, 'b'], [4, 5, 'b']])
+
+    def test_build_nullable(self):
+        glushkov = GlushkovRegex('(ab)*')
+        glushkov.build()
+        self.assertEqual(glushkov.nfa.finish_states, [0, 2])
+
+    def test_build_char_class(self):
+        glushkov = GlushkovRegex('[a-c]a')
+        glushkov.build()
+        sm = glushkov.nfa
+        self.assertEqual(sm.symbol_classes, {'b': (('b', 'c'),)})
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [0, 1, 'b'], [1, 2, 'a']])
+
+    def test_dfa(self):
+        glushkov = GlushkovRegex('a?b?(abc)*')
+        glushkov.build()
+        dfa = DfaNfa(glushkov.nfa)
+        dfa.build()
+        dfa.minimize()
+        self.assertEqual(len(dfa.dfa.states), 6)
+        self.assertEqual(dfa.matches('abbabc'), True)
+        self.assertEqual(dfa.matches('abbab'), False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from smc.lazy import LazyDfa
+from smc.nfa import NfaRegex
+
+
+def generate_lazy_dfa(regex, cache_size=None):
+    nfa = NfaRegex(regex)
+    nfa.build()
+    return LazyDfa(nfa.nfa, cache_size)
+
+
+class TestLazyDfa(unittest.TestCase):
+    def test_not_smc(self):
+        with self.assertRaises(TypeError):
+            LazyDfa([])
+
+    def test_wrong_cache_size(self):
+        nfa = NfaRegex('a')
+        nfa.build()
+        with self.assertRaises(ValueError):
+            LazyDfa(nfa.nfa, 0)
+
+    def test_matches_std(self):
+        lazy_dfa = generate_lazy_dfa('(a|b)*abb')
+        self.assertTrue(lazy_dfa.matches('ababaabb'))
+        self.assertFalse(lazy_dfa.matches('ababaab'))
+        self.assertFalse(lazy_dfa.matches('abcabb'))
+        self.assertFalse(lazy_dfa.matches(''))
+
+    def test_matches_char_class(self):
+        lazy_dfa = generate_lazy_dfa('[a-c]*d')
+        self.assertTrue(lazy_dfa.matches('cbad'))
+        self.assertFalse(lazy_dfa.matches('cbed'))
+
+    def test_step_char_class(self):
+        lazy_dfa = generate_lazy_dfa('(a|b)c')
+        state = lazy_dfa.step(lazy_dfa.init_state, 'b')
+        self.assertEqual(state, lazy_dfa.step(lazy_dfa.init_state, 'a'))
+        self.assertTrue(lazy_dfa.is_accepting(lazy_dfa.step(state, 'c')))
+        self.assertEqual(lazy_dfa.step(lazy_dfa.init_state, 'c'), frozenset())
+
+    def test_cache_hits(self):
+        lazy_dfa = generate_lazy_dfa('(a|b)*abb')
+        lazy_dfa.matches('abb')
+        self.assertEqual((lazy_dfa.hits, lazy_dfa.misses), (0, 3))
+        lazy_dfa.matches('abb')
+        self.assertEqual((lazy_dfa.hits, lazy_dfa.misses), (3, 3))
+        self.assertEqual(lazy_dfa.evictions, 0)
+
+    def test_cache_eviction(self):
+        lazy_dfa = generate_lazy_dfa('(a|b)*abb', cache_size=2)
+        self.assertTrue(lazy_dfa.matches('ababaabb'))
+        self.assertFalse(lazy_dfa.matches('ababaab'))
+        self.assertLessEqual(len(lazy_dfa.cache), 2)
+        self.assertGreater(lazy_dfa.evictions, 0)
+
+    def test_clear(self):
+        lazy_dfa = generate_lazy_dfa('(a|b)*abb')
+        lazy_dfa.matches('abb')
+        lazy_dfa.clear()
+        self.assertEqual(len(lazy_dfa.cache), 0)
+        self.assertEqual((lazy_dfa.hits, lazy_dfa.misses, lazy_dfa.evictions), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
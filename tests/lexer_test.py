@@ -0,0 +1,69 @@
+import unittest
+from smc.lexer import Lexer, Token
+
+
+def generate_lexer(rules):
+    lexer = Lexer(rules)
+    lexer.build()
+    return lexer
+
+
+RULES = [
+    ('IF', 'if'),
+    ('ID', '[a-z]([a-z0-9])*'),
+    ('NUM', '[0-9]?'),
+    ('UPPER', '[A-Z]'),
+]
+
+
+class TestLexer(unittest.TestCase):
+    def test_wrong_rule(self):
+        with self.assertRaises(TypeError):
+            Lexer(['a'])
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            Lexer([('A', 'a'), ('A', 'b')])
+
+    def test_tokenize_without_build(self):
+        with self.assertRaises(TypeError):
+            list(Lexer(RULES).tokenize('if'))
+
+    def test_tokenize_std(self):
+        lexer = generate_lexer(RULES)
+        tokens = list(lexer.tokenize('12ifXab3'))
+        self.assertEqual(tokens, [Token('NUM', '12', 0, 2), Token('IF', 'if', 2, 4),
+                                  Token('UPPER', 'X', 4, 5), Token('ID', 'ab3', 5, 8)])
+
+    def test_longest_match(self):
+        lexer = generate_lexer(RULES)
+        self.assertEqual([token.name for token in lexer.tokenize('ifx')], ['ID'])
+
+    def test_last_accept(self):
+        # После 'ab' автомат читает 'a', но лексема 'aba' недопустима
+        lexer = generate_lexer([('AB', 'ab'), ('ABAB', 'abab'), ('A', 'a')])
+        tokens = list(lexer.tokenize('abaa'))
+        self.assertEqual([token.value for token in tokens], ['ab', 'a', 'a'])
+
+    def test_unexpected_symbol(self):
+        lexer = generate_lexer(RULES)
+        tokens = lexer.tokenize('if$')
+        self.assertEqual(next(tokens), Token('IF', 'if', 0, 2))
+        with self.assertRaises(ValueError):
+            next(tokens)
+
+    def test_tokenize_stream(self):
+        lexer = generate_lexer(RULES)
+        text = '12ifXab3Yif'
+        expected = list(lexer.tokenize(text))
+        for size in range(1, len(text) + 1):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            self.assertEqual(list(lexer.tokenize_stream(chunks)), expected)
+
+    def test_tokenize_empty(self):
+        lexer = generate_lexer(RULES)
+        self.assertEqual(list(lexer.tokenize('')), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
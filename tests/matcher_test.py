@@ -0,0 +1,91 @@
+import unittest
+from smc.dfa import DfaNfa
+from smc.matcher import DfaMatcher, StreamMatcher
+from smc.nfa import NfaRegex
+from tests.smc_test import generate_simple_smc
+
+
+def generate_matcher(regex, minimize=True):
+    nfa = NfaRegex(regex)
+    nfa.build()
+    dfa = DfaNfa(nfa.nfa)
+    dfa.build()
+    if minimize:
+        dfa.minimize()
+    return dfa.compile()
+
+
+class TestDfaMatcher(unittest.TestCase):
+    def test_not_smc(self):
+        with self.assertRaises(TypeError):
+            DfaMatcher([])
+
+    def test_table_simple(self):
+        matcher = DfaMatcher(generate_simple_smc())
+        self.assertEqual(matcher.alphabet, ('a',))
+        self.assertEqual(matcher.width, 2)
+        self.assertEqual(matcher.dead_state, 4)
+        self.assertEqual(list(matcher.table), [2, 4, 4, 4, 4, 4])
+        self.assertEqual(list(matcher.accepting), [0, 1, 0])
+
+    def test_not_deterministic(self):
+        smc = generate_simple_smc()
+        smc.add_transition(0, 2, 'a')
+        with self.assertRaises(ValueError):
+            DfaMatcher(smc)
+
+    def test_compile_without_build(self):
+        nfa = NfaRegex('a')
+        nfa.build()
+        with self.assertRaises(TypeError):
+            DfaNfa(nfa.nfa).compile()
+
+    def test_match_std(self):
+        matcher = generate_matcher('(a|b)*abb')
+        self.assertTrue(matcher.match('ababaabb'))
+        self.assertTrue(matcher.match('abb'))
+        self.assertFalse(matcher.match('ababaab'))
+        self.assertFalse(matcher.match(''))
+
+    def test_match_unknown_symbol(self):
+        matcher = generate_matcher('(a|b)*abb')
+        self.assertFalse(matcher.match('abcabb'))
+
+    def test_match_not_minimized(self):
+        matcher = generate_matcher('a?b?(abc)*', minimize=False)
+        self.assertTrue(matcher.match('abbabc'))
+        self.assertFalse(matcher.match('abbab'))
+        self.assertFalse(matcher.match('b'))
+
+
+class TestStreamMatcher(unittest.TestCase):
+    def test_not_matcher(self):
+        with self.assertRaises(TypeError):
+            StreamMatcher([])
+
+    def test_feed_chunks(self):
+        stream = generate_matcher('(a|b)*abb').stream()
+        self.assertTrue(stream.feed('aba'))
+        self.assertFalse(stream.is_accepting())
+        self.assertTrue(stream.feed(''))
+        self.assertTrue(stream.feed('bb'))
+        self.assertTrue(stream.is_accepting())
+        self.assertTrue(stream.finish())
+
+    def test_feed_dead(self):
+        stream = generate_matcher('(a|b)*abb').stream()
+        self.assertFalse(stream.feed('abc'))
+        self.assertTrue(stream.is_dead())
+        self.assertFalse(stream.feed('abb'))
+        self.assertFalse(stream.finish())
+
+    def test_finish_resets(self):
+        stream = generate_matcher('(a|b)*abb').stream()
+        stream.feed('ab')
+        self.assertFalse(stream.finish())
+        stream.feed('abb')
+        self.assertTrue(stream.finish())
+
+
+if __name__ == "__main__":
+    unittest.main()
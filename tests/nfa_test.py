@@ -5,7 +5,8 @@ from smc.nfa import NfaRegex
 class TestNfaRegex(unittest.TestCase):
     def test_build_basic(self):
         nfa = NfaRegex('a')
-        sm = nfa._build_basic_sm('a')
+        nfa.build()
+        sm = nfa.nfa
         self.assertEqual(sm.states, [0, 1])
         self.assertEqual(sm.init_state, 0)
         self.assertEqual(sm.finish_states, [1])
@@ -15,9 +16,8 @@ class TestNfaRegex(unittest.TestCase):
 
     def test_build_and(self):
         nfa = NfaRegex('a&b')
-        sm1 = nfa._build_basic_sm('a')
-        sm2 = nfa._build_basic_sm('b')
-        sm = nfa._build_and_sm(sm1, sm2)
+        nfa.build()
+        sm = nfa.nfa
         self.assertEqual(sm.states, [0, 1, 2])
         self.assertEqual(sm.init_state, 0)
         self.assertEqual(sm.finish_states, [2])
@@ -27,43 +27,106 @@ class TestNfaRegex(unittest.TestCase):
 
     def test_build_or(self):
         nfa = NfaRegex('a|b')
-        sm1 = nfa._build_basic_sm('a')
-        sm2 = nfa._build_basic_sm('b')
-        sm = nfa._build_or_sm(sm1, sm2)
-        self.assertEqual(sm.states, [0, 1, 2, 3, 4, 5])
+        nfa.build()
+        sm = nfa.nfa
+        self.assertEqual(sm.states, [0, 1])
         self.assertEqual(sm.init_state, 0)
-        self.assertEqual(sm.finish_states, [5])
-        self.assertEqual(sm.catch_state, 5)
-        self.assertEqual(sm.language, ['a', 'b'])
-        self.assertEqual(sm.transitions, [[0, 1, 'ε'], [0, 3, 'ε'],
-                                          [1, 2, 'a'], [3, 4, 'b'],
-                                          [2, 5, 'ε'], [4, 5, 'ε']])
+        self.assertEqual(sm.finish_states, [1])
+        self.assertEqual(sm.catch_state, 1)
+        self.assertEqual(sm.language, ['a'])
+        self.assertEqual(sm.symbol_classes, {'a': (('a', 'b'),)})
+        self.assertEqual(sm.transitions, [[0, 1, 'a']])
+
+    def test_build_or_fragments(self):
+        nfa = NfaRegex('(ab)|c')
+        nfa.build()
+        sm = nfa.nfa
+        self.assertEqual(sm.states, [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(sm.init_state, 5)
+        self.assertEqual(sm.finish_states, [6])
+        self.assertEqual(sm.language, ['a', 'b', 'c'])
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [1, 2, 'b'],
+                                          [2, 6, 'ε'], [3, 4, 'c'],
+                                          [4, 6, 'ε'], [5, 0, 'ε'],
+                                          [5, 3, 'ε']])
 
     def test_build_zero_or_more(self):
         nfa = NfaRegex('a*')
-        sm1 = nfa._build_basic_sm('a')
-        sm = nfa._build_zero_or_more_sm(sm1)
+        nfa.build()
+        sm = nfa.nfa
         self.assertEqual(sm.states, [0, 1, 2, 3])
-        self.assertEqual(sm.init_state, 0)
+        self.assertEqual(sm.init_state, 2)
         self.assertEqual(sm.finish_states, [3])
         self.assertEqual(sm.catch_state, 3)
         self.assertEqual(sm.language, ['a'])
-        self.assertEqual(sm.transitions, [[0, 1, 'ε'], [0, 3, 'ε'],
-                                          [1, 2, 'a'], [2, 1, 'ε'],
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [1, 0, 'ε'],
+                                          [1, 3, 'ε'], [2, 0, 'ε'],
                                           [2, 3, 'ε']])
 
     def test_build_one_or_more(self):
         nfa = NfaRegex('a?')
-        sm1 = nfa._build_basic_sm('a')
-        sm = nfa._build_one_or_more_sm(sm1)
-        self.assertEqual(sm.states, [0, 1, 2, 4, 3])
-        self.assertEqual(sm.init_state, 0)
-        self.assertEqual(sm.finish_states, [4])
-        self.assertEqual(sm.catch_state, 4)
+        nfa.build()
+        sm = nfa.nfa
+        self.assertEqual(sm.states, [0, 1, 2, 3])
+        self.assertEqual(sm.init_state, 2)
+        self.assertEqual(sm.finish_states, [3])
+        self.assertEqual(sm.catch_state, 3)
         self.assertEqual(sm.language, ['a'])
-        self.assertEqual(sm.transitions, [[0, 1, 'a'], [1, 2, 'ε'],
-                                          [1, 4, 'ε'], [2, 3, 'a'],
-                                          [3, 2, 'ε'], [3, 4, 'ε']])
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [1, 0, 'ε'],
+                                          [1, 3, 'ε'], [2, 0, 'ε']])
+
+    def test_build_and_merges_states(self):
+        nfa = NfaRegex('a*b')
+        nfa.build()
+        sm = nfa.nfa
+        self.assertEqual(sm.states, [0, 1, 2, 3, 4])
+        self.assertEqual(sm.init_state, 2)
+        self.assertEqual(sm.finish_states, [4])
+        self.assertEqual(sm.transitions, [[0, 1, 'a'], [1, 0, 'ε'],
+                                          [1, 3, 'ε'], [2, 0, 'ε'],
+                                          [2, 3, 'ε'], [3, 4, 'b']])
+
+    def test_build_char_class(self):
+        nfa = NfaRegex('[a-z]*a')
+        nfa.build()
+        sm = nfa.nfa
+        self.assertEqual(sorted(sm.language), ['a', 'b'])
+        self.assertEqual(sm.symbol_classes, {'b': (('b', 'z'),)})
+        self.assertEqual(sm.get_symbol_chars('a'), 'a')
+        self.assertEqual(len(sm.get_symbol_map()), 26)
+
+    def test_build_simplified(self):
+        nfa = NfaRegex('((a*)*|a*)a*')
+        nfa.build()
+        self.assertEqual(len(nfa.nfa.states), 4)
+
+    def test_build_long(self):
+        nfa = NfaRegex('ab' * 2000)
+        nfa.build()
+        self.assertEqual(len(nfa.nfa.states), 4001)
+        self.assertEqual(len(nfa.nfa.transitions), 4000)
+
+    def test_build_very_long(self):
+        nfa = NfaRegex('a' * 20000)
+        nfa.build()
+        self.assertEqual(len(nfa.nfa.states), 20001)
+        self.assertEqual(len(nfa.nfa.transitions), 20000)
+
+    def test_build_deep(self):
+        nfa = NfaRegex('(a|' * 1200 + 'b' + ')c' * 1200)
+        nfa.build()
+        self.assertEqual(len(nfa.nfa.states), 5994)
+        self.assertEqual(len(nfa.nfa.transitions), 7192)
+
+    def test_build_parsing_error(self):
+        nfa = NfaRegex('a|')
+        with self.assertRaises(ValueError):
+            nfa.build()
+
+    def test_build_empty(self):
+        nfa = NfaRegex('')
+        with self.assertRaises(ValueError):
+            nfa.build()
 
 
 if __name__ == "__main__":
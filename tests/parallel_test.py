@@ -0,0 +1,82 @@
+import random
+import unittest
+from smc.cache import compile_regex
+from smc.parallel import compile_many, get_chunk_mapping, match_parallel, run_parallel
+
+PATTERNS = ['(a|b)*abb', 'a$b', '[a-z]?0', '(ab', 'a?b?(abc)*', '']
+
+
+class TestCompileMany(unittest.TestCase):
+    def test_wrong_workers(self):
+        with self.assertRaises(ValueError):
+            compile_many(PATTERNS, 0)
+
+    def test_empty(self):
+        self.assertEqual(compile_many([], 2), [])
+
+    def check_results(self, results):
+        self.assertEqual([result.pattern for result in results], PATTERNS)
+        self.assertEqual([result.error is None for result in results], [True, False, True, False, True, False])
+
+        for result in results:
+            if result.error is None:
+                matcher = compile_regex(result.pattern)
+                self.assertEqual(list(result.matcher.table), list(matcher.table))
+                self.assertEqual(result.matcher.accepting, matcher.accepting)
+            else:
+                self.assertIsNone(result.matcher)
+                self.assertIsInstance(result.error, ValueError)
+
+        self.assertTrue(results[0].matcher.match('babb'))
+        self.assertTrue(results[2].matcher.match('xyz0'))
+
+    def test_compile_many_processes(self):
+        self.check_results(compile_many(PATTERNS, 2))
+
+    def test_compile_many_single_process(self):
+        self.check_results(compile_many(PATTERNS, 1))
+
+
+def run_sequential(matcher, text, state=None):
+    if state is None:
+        state = matcher.init_state
+    for char in text:
+        state = matcher.table[state + matcher.columns.get(char, matcher.unknown_column)]
+    return state
+
+
+class TestParallelMatch(unittest.TestCase):
+    def test_not_matcher(self):
+        with self.assertRaises(TypeError):
+            run_parallel([], 'ab')
+
+    def test_wrong_chunk_size(self):
+        with self.assertRaises(ValueError):
+            run_parallel(compile_regex('a'), 'a', 1, 0)
+
+    def test_chunk_mapping(self):
+        matcher = compile_regex('(ab)*')
+        mapping = get_chunk_mapping(matcher, 'ba')
+        width = matcher.width
+        for state in range(matcher.states_count):
+            self.assertEqual(mapping[state], run_sequential(matcher, 'ba', state * width))
+
+    def test_same_as_sequential(self):
+        random.seed(1)
+        matcher = compile_regex('(a|b)*a(a|b)(a|b)')
+        for _ in range(20):
+            text = ''.join(random.choice('ab') for _ in range(random.randint(0, 60)))
+            for chunk_size in [1, 3, 7, 100]:
+                self.assertEqual(run_parallel(matcher, text, 1, chunk_size), run_sequential(matcher, text))
+                self.assertEqual(match_parallel(matcher, text, 1, chunk_size), matcher.match(text))
+
+    def test_match_parallel_processes(self):
+        matcher = compile_regex('[a-c]*abb')
+        text = 'abcabc' * 1000 + 'abb'
+        self.assertEqual(match_parallel(matcher, text, 2), True)
+        self.assertEqual(match_parallel(matcher, text + 'x' + text, 2, 1000), False)
+        self.assertEqual(run_parallel(matcher, text[:-1], 3, 700), run_sequential(matcher, text[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from regex_ast import (Concat, Epsilon, Plus, Star, Symbol, Union, build_ast,
+                       is_nullable, parse_regex, simplify)
+from utils import prepare_regex
+
+
+class TestBuildAst(unittest.TestCase):
+    def test_build(self):
+        result = build_ast(prepare_regex('(a|b)*abb'))
+        self.assertEqual(result, Concat([Star(Union([Symbol('a'), Symbol('b')])),
+                                         Symbol('a'), Symbol('b'), Symbol('b')]))
+
+    def test_build_plus(self):
+        self.assertEqual(build_ast(prepare_regex('a?')), Plus(Symbol('a')))
+
+    def test_build_long(self):
+        result = build_ast(prepare_regex('(a(b(c' * 2000 + ')))' * 2000))
+        self.assertEqual(len(result.items), 6000)
+
+    def test_build_deep(self):
+        regex = '(a|' * 2000 + 'b' + ')c' * 2000
+        self.assertEqual(build_ast(prepare_regex(regex)), build_ast(prepare_regex(regex)))
+        self.assertEqual(is_nullable(build_ast(prepare_regex(regex))), False)
+
+    def test_parsing_error(self):
+        with self.assertRaises(ValueError):
+            build_ast(['a', '|'])
+
+    def test_nullable(self):
+        self.assertEqual(is_nullable(build_ast(prepare_regex('a*b*'))), True)
+        self.assertEqual(is_nullable(build_ast(prepare_regex('a*b'))), False)
+        self.assertEqual(is_nullable(build_ast(prepare_regex('(a|b*)?'))), True)
+
+
+class TestSimplify(unittest.TestCase):
+    def test_star_of_star(self):
+        self.assertEqual(parse_regex('(a*)*'), Star(Symbol('a')))
+        self.assertEqual(parse_regex('(a?)*'), Star(Symbol('a')))
+        self.assertEqual(parse_regex('(a*)?'), Star(Symbol('a')))
+        self.assertEqual(parse_regex('(a?)?'), Plus(Symbol('a')))
+
+    def test_same_alternatives(self):
+        self.assertEqual(parse_regex('a|a'), Symbol('a'))
+        self.assertEqual(parse_regex('(ab)|(ab)'), Concat([Symbol('a'), Symbol('b')]))
+
+    def test_symbol_set(self):
+        self.assertEqual(parse_regex('(a|b)|a'), Symbol('ab'))
+        self.assertEqual(parse_regex('(a|b|c)d'), Concat([Symbol('abc'), Symbol('d')]))
+
+    def test_star_concat(self):
+        self.assertEqual(parse_regex('a*a*'), Star(Symbol('a')))
+        self.assertEqual(parse_regex('a*a*b'), Concat([Star(Symbol('a')), Symbol('b')]))
+
+    def test_common_prefix(self):
+        self.assertEqual(parse_regex('(ab)|(ac)'),
+                         Concat([Symbol('a'), Symbol('bc')]))
+        self.assertEqual(parse_regex('(ab)|a'),
+                         Concat([Symbol('a'), Union([Symbol('b'), Epsilon()])]))
+
+    def test_long_common_prefix(self):
+        self.assertEqual(parse_regex('(' + 'a' * 3000 + 'b)|(' + 'a' * 3000 + 'c)'),
+                         Concat([Symbol('a')] * 3000 + [Symbol('bc')]))
+
+    def test_deep(self):
+        self.assertEqual(parse_regex('(' * 2000 + 'a' + ')*' * 2000), Star(Symbol('a')))
+
+    def test_epsilon_in_star(self):
+        node = simplify(Star(Union([Epsilon(), Symbol('a')])))
+        self.assertEqual(node, Star(Symbol('a')))
+
+    def test_epsilon_with_nullable(self):
+        node = simplify(Union([Epsilon(), Star(Symbol('a'))]))
+        self.assertEqual(node, Star(Symbol('a')))
+
+
+if __name__ == "__main__":
+    unittest.main()
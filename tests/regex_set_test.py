@@ -0,0 +1,55 @@
+import unittest
+from smc.regex_set import RegexSet
+
+
+def generate_regex_set(patterns):
+    regex_set = RegexSet(patterns)
+    regex_set.build()
+    return regex_set
+
+
+class TestRegexSet(unittest.TestCase):
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            RegexSet([])
+
+    def test_unacceptable(self):
+        with self.assertRaises(ValueError):
+            RegexSet(['ab', 'a$'])
+
+    def test_not_str(self):
+        with self.assertRaises(TypeError):
+            RegexSet(['ab', 1])
+
+    def test_match_without_build(self):
+        with self.assertRaises(TypeError):
+            RegexSet(['a']).match('a')
+
+    def test_match_std(self):
+        regex_set = generate_regex_set(['(a|b)*abb', 'a?b*', '[a-c]*', 'c'])
+        self.assertEqual(regex_set.match('abb'), [0, 1, 2])
+        self.assertEqual(regex_set.match('aab'), [1, 2])
+        self.assertEqual(regex_set.match('c'), [2, 3])
+        self.assertEqual(regex_set.match(''), [2])
+        self.assertEqual(regex_set.match('d'), [])
+        self.assertEqual(regex_set.match_patterns('bab'), ['[a-c]*'])
+
+    def test_minimize_keeps_labels(self):
+        # Выражения задают один язык, но их принимающие состояния не объединяются с другими
+        regex_set = generate_regex_set(['ab', '(a)(b)', 'a'])
+        self.assertEqual(regex_set.match('ab'), [0, 1])
+        self.assertEqual(regex_set.match('a'), [2])
+        self.assertEqual(len(regex_set.dfa.dfa.states), 3)
+        self.assertEqual(regex_set.dfa.dfa.finish_labels, {1: {2}, 2: {0, 1}})
+
+    def test_same_as_single_patterns(self):
+        patterns = ['(a|b)*a(a|b)', '[a-z]?', 'b?a*', '[^a]b', '(ab|ba)*']
+        regex_set = generate_regex_set(patterns)
+        singles = [generate_regex_set([pattern]) for pattern in patterns]
+        for chain in ['', 'a', 'ab', 'ba', 'bb', 'aab', 'abab', 'zb', 'baaa', 'x1']:
+            expected = [i for i, single in enumerate(singles) if single.match(chain)]
+            self.assertEqual(regex_set.match(chain), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
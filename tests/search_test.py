@@ -0,0 +1,55 @@
+import unittest
+from smc.nfa import NfaRegex
+from smc.search import Searcher
+
+
+def generate_searcher(regex):
+    nfa = NfaRegex(regex)
+    nfa.build()
+    return Searcher(nfa.nfa)
+
+
+class TestSearcher(unittest.TestCase):
+    def test_not_smc(self):
+        with self.assertRaises(TypeError):
+            Searcher([])
+
+    def test_search_std(self):
+        searcher = generate_searcher('(a|b)*abb')
+        self.assertEqual(searcher.search('xxababbabbx'), (2, 10))
+
+    def test_search_none(self):
+        searcher = generate_searcher('(a|b)*abb')
+        self.assertEqual(searcher.search('ababxab'), None)
+
+    def test_search_char_class(self):
+        searcher = generate_searcher('[a-z]([a-z0-9])*')
+        self.assertEqual(list(searcher.finditer('12ab3 X9x')), [(2, 5), (8, 9)])
+
+    def test_finditer_non_overlapping(self):
+        searcher = generate_searcher('ab?c')
+        self.assertEqual(list(searcher.finditer('abbcxacabc')), [(0, 4), (7, 10)])
+
+    def test_finditer_leftmost_longest(self):
+        searcher = generate_searcher('(ab|a)(bc|c)')
+        self.assertEqual(list(searcher.finditer('abcabbc')), [(0, 3), (3, 7)])
+
+    def test_finditer_empty_matches(self):
+        searcher = generate_searcher('a*')
+        self.assertEqual(list(searcher.finditer('baa')), [(0, 0), (1, 3), (3, 3)])
+
+    def test_finditer_long(self):
+        # Проход от каждого начала останавливается сразу за концом вхождения,
+        # хотя из состояния после 'aa' по символу c достижим допуск
+        searcher = generate_searcher('a(a|b)*c|a')
+        self.assertEqual(list(searcher.finditer('a' * 100000)), [(i, i + 1) for i in range(100000)])
+        self.assertEqual(list(searcher.finditer('a' * 50000 + 'c')), [(0, 50001)])
+
+    def test_finditer_reuse(self):
+        searcher = generate_searcher('(a|b)*abb')
+        self.assertEqual(list(searcher.finditer('abbxabb')), [(0, 3), (4, 7)])
+        self.assertEqual(list(searcher.finditer('xxababbabbx')), [(2, 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
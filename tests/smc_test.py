@@ -77,6 +77,15 @@ class TestStateMachine(unittest.TestCase):
         self.assertEqual(smc.finish_states, [1])
         self.assertEqual(smc.states, [1])
 
+    def test_add_finish_labels(self):
+        smc = StateMachine()
+        smc.add_finish_state(1, 0)
+        smc.add_finish_state(1, 2)
+        smc.add_finish_state(3)
+        self.assertEqual(smc.finish_states, [1, 3])
+        self.assertEqual(smc.get_finish_labels([1, 3]), {0, 2})
+        self.assertEqual(smc.get_finish_labels([3]), frozenset())
+
     def test_check_states_is_empty(self):
         smc = StateMachine()
         with self.assertRaises(BaseException):
@@ -120,6 +129,14 @@ class TestStateMachine(unittest.TestCase):
         self.assertEqual(smc.catch_state, 5)
         self.assertEqual(smc.transitions, [[4, 5, 'a']])
 
+    def test_renumber_finish_labels(self):
+        smc = StateMachine()
+        smc.add_init_state(0)
+        smc.add_finish_state(1, 'x')
+        smc.add_transition(0, 1, 'a')
+        smc.renumber_states(3)
+        self.assertEqual(smc.finish_labels, {5: {'x'}})
+
     def test_e_closure_state_is_none(self):
         smc = generate_simple_smc()
         result = smc.get_e_closure(None)
@@ -212,6 +229,50 @@ class TestStateMachine(unittest.TestCase):
         self.assertEqual(smc.language, ['a', 'b'])
         self.assertEqual(smc.transitions, [[0, 1, 'a'], [0, 1, 'b']])
 
+    def test_add_tran_duplicate(self):
+        smc = generate_simple_smc()
+        smc.add_transition(0, 1, 'a')
+        self.assertEqual(smc.transitions, [[0, 1, 'a']])
+        self.assertEqual(smc.get_move(0, 'a'), [1])
+
+    def test_move_after_renumber(self):
+        smc = generate_simple_smc()
+        smc.renumber_states(3)
+        self.assertEqual(smc.get_move(4, 'a'), [5])
+        self.assertEqual(smc.get_come(5, 'a'), [4])
+        self.assertEqual(smc.get_move(0, 'a'), None)
+
+    def test_move_after_combine(self):
+        smc = generate_simple_smc()
+        smc.add_transition(0, 2, 'b')
+        smc.add_transition(2, 0, 'a')
+        smc.add_finish_state(2)
+        smc.combine_states([1, 2])
+        self.assertEqual(smc.get_move(0, 'b'), [1])
+        self.assertEqual(smc.get_come_list([0], 'a'), [1])
+
+    def test_e_closure_table_cycle(self):
+        smc = generate_simple_smc()
+        smc.add_transition(1, 2, 'ε')
+        smc.add_transition(2, 3, 'ε')
+        smc.add_transition(3, 1, 'ε')
+        smc.add_transition(3, 4, 'ε')
+        table = smc.get_e_closure_table()
+        self.assertEqual(table[0], frozenset([0]))
+        self.assertEqual(table[1], frozenset([1, 2, 3, 4]))
+        self.assertEqual(table[2], frozenset([1, 2, 3, 4]))
+        self.assertEqual(table[4], frozenset([4]))
+        self.assertEqual(smc.get_e_closure(3), [1, 2, 3, 4])
+        self.assertEqual(smc.get_e_closure_list([0, 4]), [0, 4])
+
+    def test_e_closure_table_reset(self):
+        smc = generate_simple_smc()
+        self.assertEqual(smc.get_e_closure(0), [0])
+        smc.add_transition(0, 1, 'ε')
+        self.assertEqual(smc.get_e_closure(0), [0, 1])
+        smc.renumber_states()
+        self.assertEqual(smc.get_e_closure(1), [1, 2])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from smc.cache import compile_regex
+from smc.regex_set import RegexSet
+from smc.storage import DiskCache, dump_matcher, load_matcher, loads_matcher, save_matcher
+
+
+class TestStorage(unittest.TestCase):
+    def test_dump_loads(self):
+        matcher = compile_regex('(a|b)*abb')
+        loaded = loads_matcher(dump_matcher(matcher))
+        self.assertEqual(loaded.alphabet, matcher.alphabet)
+        self.assertEqual(list(loaded.table), list(matcher.table))
+        self.assertEqual(loaded.accepting, matcher.accepting)
+        self.assertEqual(loaded.init_state, matcher.init_state)
+        self.assertTrue(loaded.match('ababb'))
+        self.assertFalse(loaded.match('abab'))
+
+    def test_dump_loads_char_class(self):
+        matcher = compile_regex('[a-f]*x')
+        loaded = loads_matcher(dump_matcher(matcher))
+        self.assertEqual(loaded.alphabet, ('abcdef', 'x'))
+        self.assertTrue(loaded.match('fadex'))
+        self.assertFalse(loaded.match('fadeg'))
+
+    def test_dump_loads_labels(self):
+        regex_set = RegexSet(['ab', 'a(b|c)', 'c'])
+        regex_set.build()
+        loaded = loads_matcher(dump_matcher(regex_set.matcher))
+        self.assertEqual(loaded.labels, regex_set.matcher.labels)
+        self.assertEqual(loaded.match_labels('ab'), frozenset({0, 1}))
+        self.assertEqual(loaded.match_labels('c'), frozenset({2}))
+        self.assertEqual(loaded.match_labels('b'), frozenset())
+
+    def test_loads_broken(self):
+        data = dump_matcher(compile_regex('a?b'))
+        with self.assertRaises(ValueError):
+            loads_matcher(data[:-1])
+        with self.assertRaises(ValueError):
+            loads_matcher(b'XXXX' + data[4:])
+
+    def test_save_load(self):
+        matcher = compile_regex('a?b?(abc)*')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sub', 'matcher.dfa')
+            save_matcher(matcher, path)
+            loaded = load_matcher(path)
+            self.assertTrue(loaded.table.readonly)
+            self.assertTrue(loaded.match('abbabc'))
+            self.assertFalse(loaded.match('abbab'))
+            self.assertTrue(loaded.stream().feed('abcd') is False)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskCache(directory)
+            matcher = cache.get('(a|b)*abb')
+            self.assertTrue(os.path.exists(cache.get_path('(a|b)*abb')))
+            loaded = cache.get('(a|b)*abb')
+            self.assertEqual(list(loaded.table), list(matcher.table))
+            self.assertNotEqual(cache.get_path('(a|b)*abb'), cache.get_path('(a|b)*ab'))
+
+    def test_disk_cache_broken_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskCache(directory)
+            with open(cache.get_path('a?'), 'wb') as f:
+                f.write(b'broken')
+            self.assertTrue(cache.get('a?').match('aa'))
+            self.assertTrue(load_matcher(cache.get_path('a?')).match('aa'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from utils import prepare_regex
+from utils import build_symbol_classes, get_intervals, parse_char_class, prepare_regex
 
 
 class TestPrepareRegex(unittest.TestCase):
@@ -27,10 +27,32 @@ class TestPrepareRegex(unittest.TestCase):
         result = ''.join(prepare_regex('(a|b)*a?b?c'))
         self.assertEqual(result, 'ab|*a?&b?&c&')
 
+    def test_char_class(self):
+        result = prepare_regex('[a-c0]*d')
+        self.assertEqual(result, ['[a-c0]', '*', 'd', '&'])
+
+    def test_char_class_errors(self):
+        for regex in ['[a-c', 'a-c', '[]', '[c-a]', '[a-]', '[^a-zA-Z0-9]', 'a]', '[a(]']:
+            with self.assertRaises(ValueError):
+                prepare_regex(regex)
+
     def test(self):
         result = ''.join(prepare_regex('(a|b|c)&(a|b)'))
         print(result)
 
 
+class TestCharClasses(unittest.TestCase):
+    def test_parse_char_class(self):
+        self.assertEqual(parse_char_class('[a-d0-2x]'), frozenset('abcd012x'))
+        self.assertEqual(parse_char_class('[^b-zA-Z0-9]'), frozenset('a'))
+
+    def test_get_intervals(self):
+        self.assertEqual(get_intervals('cab09z'), (('0', '0'), ('9', '9'), ('a', 'c'), ('z', 'z')))
+
+    def test_build_symbol_classes(self):
+        classes = build_symbol_classes([set('abcdef'), set('a'), set('def')])
+        self.assertEqual(classes, {'a': (('a', 'a'),), 'b': (('b', 'c'),), 'd': (('d', 'f'),)})
+
+
 if __name__ == "__main__":
     unittest.main()
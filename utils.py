@@ -14,19 +14,126 @@ def check_regex_symbols(regex_str):
     return True
 
 
+def parse_char_class(token):
+    """
+    Множество символов класса вида [a-z0-9] или [^a-z]. Диапазон
+    включает допустимые символы с кодами от первого до второго,
+    отрицание берется относительно всех допустимых символов.
+    """
+    if len(token) < 3 or token[0] != RegexConfig.CLASS_OPEN or token[-1] != RegexConfig.CLASS_CLOSE:
+        raise ValueError('Character class parsing error')
+
+    body = token[1:-1]
+    negate = body[0] == RegexConfig.CLASS_NEGATE
+    if negate:
+        body = body[1:]
+
+    if not body:
+        raise ValueError('Character class parsing error')
+
+    chars = set()
+    i = 0
+    while i < len(body):
+        if body[i] not in RegexConfig.VALID_SYMBOLS:
+            raise ValueError('Character class parsing error')
+
+        if i + 1 < len(body) and body[i + 1] == RegexConfig.CLASS_RANGE:
+            if i + 2 >= len(body) or body[i + 2] not in RegexConfig.VALID_SYMBOLS or body[i] > body[i + 2]:
+                raise ValueError('Character class parsing error')
+            chars.update(char for char in RegexConfig.VALID_SYMBOLS if body[i] <= char <= body[i + 2])
+            i += 3
+        else:
+            chars.add(body[i])
+            i += 1
+
+    if negate:
+        chars = set(RegexConfig.VALID_SYMBOLS) - chars
+        if not chars:
+            raise ValueError('Character class parsing error')
+
+    return frozenset(chars)
+
+
+def get_symbol_chars(token):
+    """Множество символов, задаваемых символом или классом выражения.
+    Для операторов возвращает None"""
+    if len(token) == 1 and token in RegexConfig.VALID_SYMBOLS:
+        return frozenset(token)
+
+    if token.startswith(RegexConfig.CLASS_OPEN):
+        return parse_char_class(token)
+
+    return None
+
+
+def get_intervals(chars):
+    """Представление множества символов списком интервалов (первый, последний)"""
+    intervals = []
+    for char in sorted(chars):
+        if intervals and ord(intervals[-1][1]) + 1 == ord(char):
+            intervals[-1] = (intervals[-1][0], char)
+        else:
+            intervals.append((char, char))
+    return tuple(intervals)
+
+
+def get_interval_chars(intervals):
+    """Строка всех символов интервалов"""
+    return ''.join(chr(code) for first, last in intervals for code in range(ord(first), ord(last) + 1))
+
+
+def build_symbol_classes(char_sets):
+    """
+    Разбиение символов на классы эквивалентности: символы одного класса
+    входят в одни и те же множества char_sets и неразличимы для автомата.
+    Результат: наименьший символ класса -> интервалы класса.
+    """
+    signatures = dict()
+    for index, chars in enumerate(char_sets):
+        for char in chars:
+            signatures.setdefault(char, []).append(index)
+
+    classes = dict()
+    for char, signature in signatures.items():
+        classes.setdefault(tuple(signature), []).append(char)
+
+    return {min(chars): get_intervals(chars) for chars in sorted(classes.values(), key=min)}
+
+
+def split_regex(infix_regex_str):
+    """Разбиение выражения на элементы: операторы, символы и классы символов"""
+    tokens = []
+    i = 0
+    while i < len(infix_regex_str):
+        char = infix_regex_str[i]
+        if char == RegexConfig.CLASS_OPEN:
+            end = infix_regex_str.find(RegexConfig.CLASS_CLOSE, i + 1)
+            if end == -1:
+                raise ValueError('Missing closing class bracket')
+            tokens.append(infix_regex_str[i:end + 1])
+            parse_char_class(tokens[-1])
+            i = end + 1
+        elif char in RegexConfig.VALID_CLASS_CHARS:
+            raise ValueError('Class symbols outside of character class')
+        else:
+            tokens.append(char)
+            i += 1
+    return tokens
+
+
 def prepare_regex(infix_regex_str):
     """
     Фильтрация пробельных символов входной строки, добавление неявных знаков
     конкатенации и преобразование в postfix-форму. Включает так же проверку
     на допустимые символы и корректность расставленных скобок.
-    Выход в виде списка.
+    Выход в виде списка, класс символов [...] - один элемент списка.
     """
     infix_regex_str = infix_regex_str.replace(' ', '')
 
     if not check_regex_symbols(infix_regex_str):
         raise ValueError('Unacceptable symbols in regex')
 
-    infix_list = list(infix_regex_str)
+    infix_list = split_regex(infix_regex_str)
 
     # Добавление неявных знаков конкатенации
     infix_list_concat = []